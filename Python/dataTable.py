@@ -0,0 +1,159 @@
+"""
+----------------------------------------------------------------------
+    dataTable.py
+----------------------------------------------------------------------
+    This class holds a table of simulation data (e.g. the columns of a
+    storage file) as one 2D array (rows x columns) and a map of the
+    column names to column indices.  Columns are accessed by name like
+    a dictionary (table['time'] is a view of the column), so that code
+    written for dictionaries of columns keeps working, while the whole
+    array stays available (table.data) for vectorized maths across
+    columns.
+
+    Several columns can be selected at once (a view if the columns are
+    evenly spaced, otherwise a copy), and the rows within a time range
+    can be sliced (a view).  A table pickles as its names and array
+    only, e.g. when returned from a worker pool.
+
+    Input:
+        Column names and data array
+    Output:
+        Table with column access by name
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# Imports
+import numpy as np
+
+
+"""*******************************************************************
+*                   Data Table                                       *
+*******************************************************************"""
+
+class dataTable(object):
+    """
+    A table of named columns backed by one 2D array.
+    """
+
+    __slots__ = ('names','data','columns')
+
+    def __init__(self,names,data):
+        """
+        Create an instance of the class from the column names and a
+        (rows x columns) array.
+        """
+        data = np.asarray(data)
+        if data.ndim != 2 or data.shape[1] != len(names):
+            raise ValueError(str(len(names))+' column names for data of shape '+str(data.shape))
+        # Column names
+        self.names = list(names)
+        # Data array (rows x columns)
+        self.data = data
+        # Column indices by name
+        self.columns = dict((name,k) for (k,name) in enumerate(self.names))
+
+    """------------------------------------------------------------"""
+    def __getitem__(self,name):
+        """
+        Return the named column (a view).
+        """
+        return self.data[:,self.columns[name]]
+
+    """------------------------------------------------------------"""
+    def __contains__(self,name):
+        """
+        Return True if the table has a column of the name.
+        """
+        return name in self.columns
+
+    """------------------------------------------------------------"""
+    def __iter__(self):
+        """
+        Iterate over the column names.
+        """
+        return iter(self.names)
+
+    """------------------------------------------------------------"""
+    def __len__(self):
+        """
+        Return the number of columns (as for a dictionary of columns).
+        """
+        return len(self.names)
+
+    """------------------------------------------------------------"""
+    def keys(self):
+        """
+        Return the column names.
+        """
+        return list(self.names)
+
+    """------------------------------------------------------------"""
+    def values(self):
+        """
+        Return the columns (views).
+        """
+        return [self.data[:,k] for k in range(len(self.names))]
+
+    """------------------------------------------------------------"""
+    def items(self):
+        """
+        Return the (name, column) pairs.
+        """
+        return list(zip(self.names,self.values()))
+
+    """------------------------------------------------------------"""
+    def get(self,name,default=None):
+        """
+        Return the named column, or the default if there is none.
+        """
+        if name in self.columns:
+            return self[name]
+        return default
+
+    """------------------------------------------------------------"""
+    def select(self,names):
+        """
+        Return a table of the named columns (in the given order).  The
+        array is a view if the columns are evenly spaced in this table
+        (e.g. adjacent muscles), otherwise a copy.
+        """
+        indices = [self.columns[name] for name in names]
+        step = indices[1]-indices[0] if len(indices) > 1 else 1
+        if step != 0 and indices == list(range(indices[0],indices[0]+step*len(indices),step)):
+            # (Slice -- a stop of -1 would wrap around)
+            stop = indices[-1]+step
+            data = self.data[:,indices[0]:(stop if stop >= 0 else None):step]
+        else:
+            data = self.data[:,indices]
+        return dataTable(names,data)
+
+    """------------------------------------------------------------"""
+    def timeSlice(self,startTime,endTime,timeName='time'):
+        """
+        Return a table of the rows with times within a time range (a
+        view -- the times must be increasing).
+        """
+        time = self[timeName]
+        first = np.searchsorted(time,startTime,side='left')
+        last = max(first,np.searchsorted(time,endTime,side='right'))
+        return dataTable(self.names,self.data[first:last])
+
+    """------------------------------------------------------------"""
+    def __getstate__(self):
+        """
+        Pickle the names and array only (the column map is rebuilt).
+        """
+        return self.names, np.ascontiguousarray(self.data)
+
+    """------------------------------------------------------------"""
+    def __setstate__(self,state):
+        """
+        Restore the table from its names and array.
+        """
+        names, data = state
+        self.names = names
+        self.data = data
+        self.columns = dict((name,k) for (k,name) in enumerate(names))
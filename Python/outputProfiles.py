@@ -0,0 +1,137 @@
+"""
+----------------------------------------------------------------------
+    outputProfiles.py
+----------------------------------------------------------------------
+    This module contains named output profiles for the RRA, CMC and
+    Forward tools.  A profile switches off the analyses that are not
+    consumed downstream and sets the output precision and step
+    interval of a Setup XML file, which reduces the amount of data
+    written to disk and parsed by every later read.
+
+    Profiles:
+        full       -- all analyses of the baseline Setup files on (a
+                      superset of the other profiles), 20 digits
+                      (as the GUI writes)
+        analysis   -- outputs read by processResults (Actuation and
+                      Kinematics), 8 digits
+        ga-fitness -- only the Actuation forces and position errors
+                      scored by the genetic algorithm, 6 digits
+
+    Input:
+        Parsed Setup XML document, tool name, profile name
+    Output:
+        Updated Setup XML document
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# Analyses (in order) that can be switched on or off in the AnalysisSet
+analysisNames = ['Kinematics','Actuation','BodyKinematics','MuscleAnalysis']
+
+# Result files (suffixes after the tool name) written by each analysis
+analysisOutputs = {'Kinematics': ['Kinematics_dudt.sto','Kinematics_q.sto','Kinematics_u.sto'],
+                   'Actuation': ['Actuation_force.sto','Actuation_power.sto','Actuation_speed.sto'],
+                   'BodyKinematics': ['BodyKinematics_acc_global.sto','BodyKinematics_pos_global.sto',
+                                      'BodyKinematics_vel_global.sto'],
+                   'MuscleAnalysis': []}
+
+# Result files written by each tool regardless of the analyses
+toolOutputs = {'RRA': ['avgResiduals.txt','controls.sto','controls.xml','pErr.sto','states.sto'],
+               'CMC': ['controls.sto','controls.xml','pErr.sto','states.sto'],
+               'Forward': ['controls.sto','states.sto']}
+
+# Profile definitions: analyses switched on (per tool), precision and step interval
+profiles = {'full': {'analyses': {'RRA': ['Kinematics','Actuation','BodyKinematics'],
+                                  'CMC': ['Kinematics','Actuation','BodyKinematics'],
+                                  'Forward': ['Kinematics','Actuation','BodyKinematics','MuscleAnalysis']},
+                     'precision': 20,
+                     'stepInterval': 10},
+            'analysis': {'analyses': {'RRA': ['Kinematics','Actuation'],
+                                      'CMC': ['Kinematics','Actuation'],
+                                      'Forward': ['Kinematics']},
+                         'precision': 8,
+                         'stepInterval': 10},
+            'ga-fitness': {'analyses': {'RRA': ['Actuation'],
+                                        'CMC': ['Actuation'],
+                                        'Forward': ['Kinematics']},
+                           'precision': 6,
+                           'stepInterval': 10}}
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def getProfile(profileName):
+    """
+    Return the definition of the named profile.
+    """
+    if profileName not in profiles:
+        raise ValueError('Unknown output profile: '+str(profileName)+' (choose from '+', '.join(sorted(profiles))+')')
+    return profiles[profileName]
+
+# ####################################################################
+
+def expectedOutputs(toolName,profileName):
+    """
+    Return the result file suffixes (e.g. '_RRA_pErr.sto') that the
+    tool writes when it is run with the named profile.
+    """
+    profile = getProfile(profileName)
+    fspecs = list(toolOutputs[toolName])
+    for analysis in profile['analyses'][toolName]:
+        fspecs.extend(analysisOutputs[analysis])
+    return ['_'+toolName+'_'+fspec for fspec in sorted(fspecs)]
+
+# ####################################################################
+
+def setText(dom,parentElem,tagName,value):
+    """
+    Set the text of the first child element with the given tag name,
+    creating the element if it does not exist.
+    """
+    elems = parentElem.getElementsByTagName(tagName)
+    if len(elems) > 0:
+        elem = elems[0]
+        if elem.firstChild is None:
+            elem.appendChild(dom.createTextNode(''))
+    else:
+        elem = dom.createElement(tagName)
+        elem.appendChild(dom.createTextNode(''))
+        parentElem.appendChild(elem)
+    elem.firstChild.nodeValue = ' '+str(value)+' '
+
+# ####################################################################
+
+def applyOutputProfile(dom,toolName,profileName):
+    """
+    Update a parsed Setup XML document (minidom) in place according
+    to the named profile.  Analyses missing from the AnalysisSet are
+    added, so that defaults added by the tool itself are switched off
+    explicitly.
+    """
+    profile = getProfile(profileName)
+    toolElem = dom.getElementsByTagName(toolName+'Tool')[0]
+    # <output_precision>
+    setText(dom,toolElem,'output_precision',profile['precision'])
+    # <AnalysisSet>
+    analysisSets = toolElem.getElementsByTagName('AnalysisSet')
+    if len(analysisSets) == 0:
+        return dom
+    objectsElem = analysisSets[0].getElementsByTagName('objects')[0]
+    for analysis in analysisNames:
+        analysisElems = objectsElem.getElementsByTagName(analysis)
+        if len(analysisElems) > 0:
+            analysisElem = analysisElems[0]
+        else:
+            analysisElem = dom.createElement(analysis)
+            analysisElem.setAttribute('name',analysis)
+            objectsElem.appendChild(analysisElem)
+        if analysis in profile['analyses'][toolName]:
+            setText(dom,analysisElem,'on','true')
+        else:
+            setText(dom,analysisElem,'on','false')
+        setText(dom,analysisElem,'step_interval',profile['stepInterval'])
+    return dom
@@ -0,0 +1,353 @@
+"""
+----------------------------------------------------------------------
+    parameterSweep.py
+----------------------------------------------------------------------
+    This class runs a sweep of the RRA or CMC tool over values of
+    fields in the Setup XML file of a trial and in the files it
+    references (tasks, actuators, control constraints).  Each target
+    is given as a file key and an XPath-style path, e.g.
+
+        ('tasks', "CMC_Joint[@name='knee_angle_r']/weight", [1,10,100])
+        ('setup', "cmc_time_window", [0.005,0.01,0.02])
+        ('actuators', "PointActuator[@name='FX']/optimal_force", [1,4,16])
+
+    A path is a '/' separated list of tag names, each optionally with
+    an [@attribute='value'] filter.  Every step matches descendants of
+    the previous step (as '//' in XPath) and all matching elements are
+    updated.
+
+    The variants are either the full grid of the target values or a
+    Latin hypercube sample of the ranges of the target values.  Each
+    variant is written to its own directory (Setup file and modified
+    copies of the referenced files), the variants are run concurrently
+    with the tool classes in runToolsParallel, and the residuals and
+    position errors of all variants are collated into one table.
+
+    Input:
+        Trial name, tool name, sweep targets
+    Output:
+        Simulation results of each variant (in <trialName>_Sweep)
+        Table of residuals and position errors (_Sweep.data)
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Input                                            #
+#                                                                    #
+# ####################################################################
+# Trial name
+trialName = '20130221CONF_A_Walk_RepGRF'
+# Tool name ('RRA' or 'CMC')
+toolName = 'RRA'
+# Sweep targets: (file key, path, values) with optional 4th element 'log'
+# (Latin hypercube sampling in log space)
+targets = [('actuators',"PointActuator[@name='FX']/optimal_force",[1,2,4,8]),
+           ('actuators',"PointActuator[@name='FZ']/optimal_force",[1,2,4,8]),
+           ('tasks',"CMC_Joint[@name='pelvis_tilt']/weight",[1,10,100])]
+# Sampling ('grid' or 'lhs') and number of samples (for 'lhs' only)
+sampling = 'grid'
+numSamples = 20
+# ####################################################################
+
+
+# Imports
+import os
+import re
+import shutil
+import itertools
+from multiprocessing import Pool
+from xml.dom.minidom import parse
+
+import numpy as np
+
+import runToolsParallel
+import rraMetrics
+
+
+# Setup XML tags of the files that can be targeted (besides 'setup')
+fileTags = {'tasks': 'task_set_file',
+            'actuators': 'force_set_files',
+            'constraints': 'constraints_file'}
+
+# Path step, e.g. CMC_Joint[@name='knee_angle_r']
+stepPattern = re.compile(r"^(\w+)(?:\[@(\w+)=['\"]([^'\"]*)['\"]\])?$")
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def findElements(dom,path):
+    """
+    Return the elements of a parsed XML document (minidom) that match
+    an XPath-style path.
+    """
+    elems = [dom]
+    for step in path.strip('/').split('/'):
+        match = stepPattern.match(step.strip())
+        if match is None:
+            raise ValueError('Invalid path step: '+step+' (in '+path+')')
+        tagName, attrName, attrValue = match.groups()
+        newElems = []
+        for parentElem in elems:
+            for elem in parentElem.getElementsByTagName(tagName):
+                if attrName is None or elem.getAttribute(attrName) == attrValue:
+                    if elem not in newElems:
+                        newElems.append(elem)
+        elems = newElems
+    return elems
+
+# ####################################################################
+
+def setPathValue(dom,path,value):
+    """
+    Set the text of all elements matching the path.  Raises an error
+    if the path does not match any element.
+    """
+    elems = findElements(dom,path)
+    if len(elems) == 0:
+        raise ValueError('No element matches '+path)
+    for elem in elems:
+        if elem.firstChild is None:
+            elem.appendChild(dom.createTextNode(''))
+        elem.firstChild.nodeValue = ' '+str(value)+' '
+
+# ####################################################################
+
+def latinHypercube(ranges,numSamples,logScales,seed=0):
+    """
+    Return a Latin hypercube sample (numSamples x len(ranges)) of the
+    (low, high) ranges.  Each range is split into numSamples equal
+    strata (in log space for log scales) with one sample per stratum.
+    """
+    randState = np.random.RandomState(seed)
+    samples = np.zeros((numSamples,len(ranges)))
+    for (j,(low,high)) in enumerate(ranges):
+        # One random point in each stratum, strata in random order
+        u = (randState.permutation(numSamples)+randState.uniform(size=numSamples))/numSamples
+        if logScales[j]:
+            samples[:,j] = 10**(np.log10(low)+u*(np.log10(high)-np.log10(low)))
+        else:
+            samples[:,j] = low+u*(high-low)
+    return samples
+
+# ####################################################################
+
+def runVariant(task):
+    """
+    Picklable function for running the tool for one variant.  The
+    results are left in the variant folder.  Variants with existing
+    results are skipped, so that an interrupted sweep can be resumed.
+    """
+    sweepDir, variantName, toolName = task
+    if toolName == 'RRA':
+        simTool = runToolsParallel.rra(variantName)
+    elif toolName == 'CMC':
+        simTool = runToolsParallel.cmc(variantName)
+    # Run within the sweep directory
+    simTool.subDir = sweepDir
+    resultsDir = sweepDir+variantName+'\\'
+    if os.path.exists(resultsDir+variantName+'_'+toolName+'_controls.xml'):
+        return None
+    if os.path.exists(resultsDir):
+        shutil.rmtree(resultsDir)
+    simTool.copySetupXMLToSubFolder()
+    simTool.executeShell()
+    simTool.checkIfDone()
+    simTool.cleanUp()
+    return None
+
+# ####################################################################
+
+def readMetrics(resultsDir,variantName,toolName):
+    """
+    Read the residuals (Actuation_force) and position errors (pErr) of
+    a variant.  Returns a list of the max and RMS residuals (FX-MZ)
+    and the coordinate names with max and RMS position errors (cm or
+    deg).
+    """
+    # (Variant results are read once and not cached)
+    residualNames, maxResiduals, rmsResiduals, avgResiduals, posErrNames, maxPosErr, rmsPosErr = rraMetrics.trialMetrics(resultsDir+variantName+'_'+toolName+'_',cache=False)
+    return maxResiduals.tolist()+rmsResiduals.tolist(), posErrNames, maxPosErr.tolist()+rmsPosErr.tolist()
+
+# ####################################################################
+
+class parameterSweep:
+    """
+    A class to run a tool for a grid or Latin hypercube sample of
+    values of Setup XML fields for a single trial.
+    """
+
+    def __init__(self,trialName,toolName,targets,sampling='grid',numSamples=20,seed=0):
+        """
+        Create an instance of the class from the trial name, tool
+        name and sweep targets.
+        """
+        # Trial name
+        self.trialName = trialName
+        # Subject ID
+        self.subID = trialName.split('_')[0]
+        # Subject directory
+        nuDir = os.getcwd()
+        while os.path.basename(nuDir) != 'Northwestern-RIC':
+            nuDir = os.path.dirname(nuDir)
+        self.subDir = os.path.join(nuDir,'Modeling','OpenSim','Subjects',self.subID)+'\\'
+        # Tool name
+        if toolName not in ['RRA','CMC']:
+            raise ValueError('Unknown tool name: '+str(toolName)+' (choose from RRA, CMC)')
+        self.toolName = toolName
+        # Sweep targets
+        self.targets = targets
+        # Sampling method, number of samples (Latin hypercube) and random seed
+        self.sampling = sampling
+        self.numSamples = numSamples
+        self.seed = seed
+        # Sweep directory
+        self.sweepDir = self.subDir+self.trialName+'_Sweep\\'
+
+    """------------------------------------------------------------"""
+    def getVariants(self):
+        """
+        Return the list of target values of each variant.
+        """
+        if self.sampling == 'grid':
+            return [list(values) for values in itertools.product(*[target[2] for target in self.targets])]
+        elif self.sampling == 'lhs':
+            ranges = [(min(target[2]),max(target[2])) for target in self.targets]
+            logScales = [len(target) > 3 and target[3] == 'log' for target in self.targets]
+            return latinHypercube(ranges,self.numSamples,logScales,self.seed).tolist()
+        else:
+            raise ValueError('Unknown sampling method: '+str(self.sampling)+' (choose from grid, lhs)')
+
+    """------------------------------------------------------------"""
+    def getVariantName(self,n):
+        """
+        Return the name (used as the trial name by the tool) of the
+        n-th variant.
+        """
+        return self.trialName+'_V'+str(n).zfill(4)
+
+    """------------------------------------------------------------"""
+    def materialize(self,variants):
+        """
+        Write the Setup file (and modified copies of the referenced
+        files) of each variant to the sweep directory.
+        """
+        if not os.path.exists(self.sweepDir):
+            os.mkdir(self.sweepDir)
+        # Parse the Setup file and the files listed in the targeted tags once
+        setupPath = self.subDir+self.trialName+'__Setup_'+self.toolName+'.xml'
+        setupDom = parse(setupPath)
+        docs = {'setup': [(setupPath,setupDom)]}
+        for target in self.targets:
+            fileKey = target[0]
+            if fileKey not in docs:
+                if fileKey not in fileTags:
+                    raise ValueError('Unknown file key: '+str(fileKey)+' (choose from setup, '+', '.join(sorted(fileTags))+')')
+                # (A tag can list several files, relative paths are relative to the Setup file)
+                filePaths = setupDom.getElementsByTagName(fileTags[fileKey])[0].firstChild.nodeValue.split()
+                filePaths = [os.path.join(os.path.dirname(setupPath),filePath) for filePath in filePaths]
+                docs[fileKey] = [(filePath,parse(filePath)) for filePath in filePaths]
+        # Check all paths before writing anything (and find the files each target modifies)
+        targetFiles = []
+        modified = {}
+        for target in self.targets:
+            matches = [k for (k,(filePath,dom)) in enumerate(docs[target[0]]) if len(findElements(dom,target[1])) > 0]
+            if len(matches) == 0:
+                raise ValueError('No element matches '+target[1]+' in the '+target[0]+' file')
+            targetFiles.append(matches)
+            modified.setdefault(target[0],set()).update(matches)
+        for (n,values) in enumerate(variants):
+            variantName = self.getVariantName(n+1)
+            for (target,matches,value) in zip(self.targets,targetFiles,values):
+                for k in matches:
+                    setPathValue(docs[target[0]][k][1],target[1],value)
+            # Write modified copies of the referenced files (the other listed files are kept)
+            for fileKey in docs:
+                if fileKey != 'setup':
+                    filePaths = []
+                    for (k,(filePath,dom)) in enumerate(docs[fileKey]):
+                        if k in modified[fileKey]:
+                            fileNumber = str(k+1) if len(docs[fileKey]) > 1 else ''
+                            filePath = self.sweepDir+variantName+'_'+fileKey.capitalize()+fileNumber+'.xml'
+                            xmlFile = open(filePath,'wb')
+                            xmlFile.write(dom.toxml('UTF-8'))
+                            xmlFile.close()
+                        filePaths.append(filePath)
+                    setPathValue(setupDom,fileTags[fileKey],' '.join(filePaths))
+            # Write Setup file
+            setupDom.getElementsByTagName(self.toolName+'Tool')[0].setAttribute('name',variantName+'_'+self.toolName)
+            xmlFile = open(self.sweepDir+variantName+'__Setup_'+self.toolName+'.xml','wb')
+            xmlFile.write(setupDom.toxml('UTF-8'))
+            xmlFile.close()
+
+    """------------------------------------------------------------"""
+    def collate(self,variants):
+        """
+        Write a table of the target values, residuals and position
+        errors of all variants.
+        """
+        rows = []
+        posErrNames = None
+        for (n,values) in enumerate(variants):
+            variantName = self.getVariantName(n+1)
+            rowValues = [variantName]+[str(value) for value in values]
+            try:
+                residuals, names, posErrors = readMetrics(self.sweepDir+variantName+'\\',variantName,self.toolName)
+            except:
+                print ('Unable to read the results of '+variantName+'_'+self.toolName+'.')
+                rows.append('\t'.join(rowValues+['failed'])+'\n')
+                continue
+            if posErrNames is None:
+                posErrNames = names
+            rows.append('\t'.join(rowValues+['passed']+[str(value) for value in residuals+posErrors])+'\n')
+        if posErrNames is None:
+            posErrNames = []
+        # Write to file
+        numTargets = len(self.targets)
+        numCoords = len(posErrNames)
+        header1 = 'Variant\tTarget Values'+'\t'*numTargets+'Status\tMax Residual'+'\t'*6+'RMS Residual'+'\t'*5
+        if numCoords > 0:
+            header1 += '\tMax Position Error (cm or deg)'+'\t'*numCoords+'RMS Position Error (cm or deg)'+'\t'*(numCoords-1)
+        header1 += '\n'
+        header2 = '\t'.join(['']+[target[0]+':'+target[1] for target in self.targets]+['']+rraMetrics.residualNames*2+posErrNames*2)+'\n'
+        tableFile = open(self.subDir+self.trialName+'_'+self.toolName+'_Sweep.data','w')
+        tableFile.write(header1)
+        tableFile.write(header2)
+        tableFile.writelines(rows)
+        tableFile.close()
+
+    """------------------------------------------------------------"""
+    def run(self,processes=8):
+        """
+        Main program to materialize, run and collate the variants.
+        """
+        variants = self.getVariants()
+        self.materialize(variants)
+        print (str(len(variants))+' variants of '+self.trialName+'_'+self.toolName+' written to '+self.sweepDir)
+        tasks = [(self.sweepDir,self.getVariantName(n+1),self.toolName) for n in range(len(variants))]
+        # Start worker pool
+        pool = Pool(processes=processes)
+        # Run parallel processes
+        pool.map(runVariant, tasks)
+        # Clean up spawned processes
+        pool.close()
+        pool.join()
+        # Table of results
+        self.collate(variants)
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    # Create instance of class
+    sweep = parameterSweep(trialName,toolName,targets,sampling,numSamples)
+    # Run sweep
+    sweep.run()
@@ -0,0 +1,304 @@
+"""
+----------------------------------------------------------------------
+    preflightCheck.py
+----------------------------------------------------------------------
+    This class checks the inputs of the dynamic trials for a given
+    subject before any simulation is launched, so that bad trials are
+    rejected before they occupy a worker in the pool.  The marker
+    (.trc), ground reaction force (_GRF.mot) and inverse kinematics
+    (_IK.mot, if present) files are loaded as NumPy arrays (with the
+    readers of readResults) and checked column-wise for:
+        - header column counts that do not match the data
+        - NaN / blank marker gaps
+        - a GRF cycle window outside of the GRF, IK or marker data
+        - Setup XML times outside of the available data
+
+    Errors reject a trial; warnings are only reported.
+
+    Input:
+        Subject ID list
+    Output:
+        Print out of problems for the whole cohort
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Input                                            #
+#                                                                    #
+# ####################################################################
+# Subject ID list
+subIDs = ['20130401CONM','20130401AHLM','20130221CONF','20130207APRM',
+          '20121206CONF','20121205CONM','20121205CONF','20121204CONF',
+          '20121204APRM','20121110AHRM','20121108AHRM','20121008AHRM',
+          '20120920APRM','20120919APLF','20120912AHRF']
+# ####################################################################
+
+
+# Imports
+import os
+import glob
+from xml.dom.minidom import parse
+
+import numpy as np
+
+from readResults import readStorage, readTRC
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def getSetupTimes(xmlFilePath):
+    """
+    Read the simulation start and end times from a Setup XML file.
+    """
+    dom = parse(xmlFilePath)
+    if len(dom.getElementsByTagName('initial_time')) > 0:
+        startTime = float(dom.getElementsByTagName('initial_time')[0].firstChild.nodeValue)
+        endTime = float(dom.getElementsByTagName('final_time')[0].firstChild.nodeValue)
+    else:
+        timeRange = dom.getElementsByTagName('time_range')[0].firstChild.nodeValue.split()
+        startTime = float(timeRange[0])
+        endTime = float(timeRange[1])
+    return startTime, endTime
+
+
+"""*******************************************************************
+*                   Pre-flight Check                                 *
+*******************************************************************"""
+
+class preflightCheck:
+    """
+    A class to validate the simulation inputs of all dynamic trials
+    for a given subject.
+    """
+
+    def __init__(self,subID):
+        """
+        Create an instance of the class from the subject ID and add
+        the subject directory and tolerances.
+        """
+        # Subject ID
+        self.subID = subID
+        # Subject directory
+        nuDir = os.getcwd()
+        while os.path.basename(nuDir) != 'Northwestern-RIC':
+            nuDir = os.path.dirname(nuDir)
+        self.subDir = os.path.join(nuDir,'Modeling','OpenSim','Subjects',subID)+'\\'
+        # Time tolerance (setup times are rounded to the millisecond)
+        self.timeTol = 0.001
+        # Marker gaps longer than this fraction of the trial are errors
+        self.maxGapFraction = 0.1
+
+    """------------------------------------------------------------"""
+    def getTrialNames(self):
+        """
+        Get all of the dynamic trial names for the subject.
+        """
+        trialNames = glob.glob(self.subDir+self.subID+'*_GRF.mot')
+        for (i,tN) in enumerate(trialNames):
+            trialNames[i] = os.path.basename(tN).split('_GRF')[0]
+        return sorted(trialNames)
+
+    """------------------------------------------------------------"""
+    def checkColumns(self,fileName,names,data,problems):
+        """
+        Compare the number of named columns with the number of data
+        columns and flag columns containing NaN.
+        """
+        # Trailing tabs produce an extra column of NaN
+        if data.shape[1] == len(names)+1 and np.isnan(data[:,-1]).all():
+            data = data[:,:-1]
+        if data.shape[1] != len(names):
+            problems.append(('error',fileName+' has '+str(len(names))+' column names but '+str(data.shape[1])+' data columns'))
+            return data
+        nanCols = np.isnan(data).any(axis=0)
+        if nanCols.any():
+            badNames = [names[k] for k in np.flatnonzero(nanCols)]
+            problems.append(('error',fileName+' contains NaN in '+', '.join(badNames)))
+        return data
+
+    """------------------------------------------------------------"""
+    def checkTRC(self,trialName,problems):
+        """
+        Check the marker file and return its time range.
+        """
+        fileName = trialName+'.trc'
+        header, names, data = readTRC(self.subDir+fileName)
+        numMarkers = int(header['NumMarkers'])
+        numFrames = int(header['NumFrames'])
+        # Trailing tabs produce extra columns of NaN
+        nCols = 2+3*numMarkers
+        if data.shape[1] > nCols and np.isnan(data[:,nCols:]).all():
+            data = data[:,:nCols]
+        if data.shape[1] != nCols or len(names) != numMarkers:
+            problems.append(('error',fileName+' header lists '+str(numMarkers)+' markers but has '+
+                             str(len(names))+' names and '+str(data.shape[1])+' data columns'))
+            return data[0,1], data[-1,1]
+        if data.shape[0] != numFrames:
+            problems.append(('warning',fileName+' header lists '+str(numFrames)+' frames but has '+str(data.shape[0])))
+        # Marker gaps: frames where any coordinate of a marker is missing
+        gaps = np.isnan(data[:,2:]).reshape(data.shape[0],numMarkers,3).any(axis=2)
+        gapFrames = gaps.sum(axis=0)
+        for k in np.flatnonzero(gapFrames):
+            gapTimes = data[gaps[:,k],1]
+            message = (fileName+' marker '+names[k]+' is missing in '+str(gapFrames[k])+' frames ('+
+                       '%.3f-%.3f s)' %(gapTimes.min(),gapTimes.max()))
+            if gapFrames[k] > self.maxGapFraction*data.shape[0]:
+                problems.append(('error',message))
+            else:
+                problems.append(('warning',message))
+        return data[0,1], data[-1,1]
+
+    """------------------------------------------------------------"""
+    def checkGRF(self,trialName,problems):
+        """
+        Check the ground reaction force file and return its time
+        range and cycle window.
+        """
+        fileName = trialName+'_GRF.mot'
+        headerList, names, data = readStorage(self.subDir+fileName)
+        data = self.checkColumns(fileName,names,data,problems)
+        # Cycle time (line 11 of the header)
+        cycleTime = np.array(headerList[10].rstrip('\r\n').split('\t')[1:3],dtype=float)
+        if cycleTime[0] >= cycleTime[1]:
+            problems.append(('error',fileName+' cycle window %.3f-%.3f s is empty' %(cycleTime[0],cycleTime[1])))
+        return data[0,0], data[-1,0], cycleTime
+
+    """------------------------------------------------------------"""
+    def checkIK(self,trialName,problems):
+        """
+        Check the inverse kinematics file (if it already exists) and
+        return its time range.  Otherwise, return the time range from
+        the IK Setup file.
+        """
+        fileName = trialName+'_IK.mot'
+        if os.path.exists(self.subDir+fileName):
+            headerList, names, data = readStorage(self.subDir+fileName)
+            data = self.checkColumns(fileName,names,data,problems)
+            return data[0,0], data[-1,0]
+        elif os.path.exists(self.subDir+trialName+'__Setup_IK.xml'):
+            return getSetupTimes(self.subDir+trialName+'__Setup_IK.xml')
+        else:
+            return None
+
+    """------------------------------------------------------------"""
+    def checkWindow(self,label,window,rangeLabel,timeRange,problems):
+        """
+        Flag a time window that is not contained in a time range.
+        """
+        if window[0] < timeRange[0]-self.timeTol or window[1] > timeRange[1]+self.timeTol:
+            problems.append(('error',label+' %.3f-%.3f s is outside of ' %(window[0],window[1])+
+                             rangeLabel+' %.3f-%.3f s' %(timeRange[0],timeRange[1])))
+
+    """------------------------------------------------------------"""
+    def checkTrial(self,trialName):
+        """
+        Run all checks for a single trial and return a list of
+        (level, message) tuples.
+        """
+        problems = []
+        for ext in ['.trc','_GRF.mot']:
+            if not os.path.exists(self.subDir+trialName+ext):
+                problems.append(('error',trialName+ext+' is missing'))
+        if len(problems) > 0:
+            return problems
+        try:
+            trcRange = self.checkTRC(trialName,problems)
+            grfStart, grfEnd, cycleTime = self.checkGRF(trialName,problems)
+            ikRange = self.checkIK(trialName,problems)
+        except Exception as err:
+            problems.append(('error','Unable to read input files for '+trialName+' ('+str(err)+')'))
+            return problems
+        # Cycle window
+        self.checkWindow('GRF cycle window',cycleTime,'GRF data',(grfStart,grfEnd),problems)
+        self.checkWindow('GRF cycle window',cycleTime,'marker data',trcRange,problems)
+        if ikRange is not None:
+            self.checkWindow('GRF cycle window',cycleTime,'IK data',ikRange,problems)
+        # Simulation times in Setup files
+        for toolName in ['ID','RRA','CMC']:
+            xmlFilePath = self.subDir+trialName+'__Setup_'+toolName+'.xml'
+            if os.path.exists(xmlFilePath):
+                setupTimes = getSetupTimes(xmlFilePath)
+                label = toolName+' Setup time'
+                if setupTimes[0] >= setupTimes[1]:
+                    problems.append(('error',label+' %.3f-%.3f s is empty' %setupTimes))
+                self.checkWindow(label,setupTimes,'GRF data',(grfStart,grfEnd),problems)
+                if ikRange is not None:
+                    self.checkWindow(label,setupTimes,'IK data',ikRange,problems)
+                if toolName != 'ID':
+                    self.checkWindow('GRF cycle window',cycleTime,label,setupTimes,problems)
+        return problems
+
+    """------------------------------------------------------------"""
+    def run(self,trialNames=None):
+        """
+        Main program to check the given (or all) trials for the
+        subject.  Returns a dictionary mapping trial names to lists of
+        problems.
+        """
+        if trialNames is None:
+            trialNames = self.getTrialNames()
+        results = {}
+        for trialName in trialNames:
+            results[trialName] = self.checkTrial(trialName)
+        return results
+
+    """------------------------------------------------------------"""
+    def passedTrials(self,trialNames=None):
+        """
+        Return the trials without errors (in the given order),
+        printing all problems.
+        """
+        if trialNames is None:
+            trialNames = self.getTrialNames()
+        results = self.run(trialNames)
+        printProblems(results)
+        return [trialName for trialName in trialNames if not hasErrors(results[trialName])]
+
+# ####################################################################
+
+def hasErrors(problems):
+    """
+    Return True if any of the problems is an error.
+    """
+    return any(level == 'error' for (level,message) in problems)
+
+# ####################################################################
+
+def printProblems(results):
+    """
+    Print the problems for each trial, one line per problem.
+    """
+    for trialName in sorted(results):
+        for (level,message) in results[trialName]:
+            print (trialName+'\t'+level.upper()+'\t'+message)
+
+# ####################################################################
+
+def checkCohort(subIDs):
+    """
+    Check all trials for a list of subjects in one pass and print the
+    problems.  Returns a dictionary mapping trial names to problems.
+    """
+    results = {}
+    for subID in subIDs:
+        results.update(preflightCheck(subID).run())
+    printProblems(results)
+    numRejected = len([trialName for trialName in results if hasErrors(results[trialName])])
+    print (str(numRejected)+' of '+str(len(results))+' trials rejected.')
+    return results
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    # Check the whole cohort
+    checkCohort(subIDs)
@@ -0,0 +1,800 @@
+"""
+----------------------------------------------------------------------
+    readResults.py
+----------------------------------------------------------------------
+    This module contains fast readers for OpenSim storage/motion
+    (.sto, .mot) and marker (.trc) files.  The header is located from
+    its contents (the 'endheader' line, the nRows/nColumns values or
+    the TRC layout) instead of fixed line counts, and the numeric
+    block is parsed in one pass (np.loadtxt, or np.fromstring before
+    NumPy 1.23) into a contiguous float array.  readStorageHeader
+    reads only the header and column names.  readStorage can also
+    keep only a list of named columns.  Files with blank fields (e.g.
+    missing markers) fall back to np.genfromtxt, with NaN for the
+    blank fields.
+
+    Parsed files are cached as a sidecar .npy array and .json header
+    (column names, header lines and the size and modification time of
+    the source file) in a local cache folder (cacheDir, by default
+    readResultsCache in the temporary folder, so that nothing is
+    written to the subject folders on the share), or next to the
+    source file with cacheDir = None.  Later reads of an unchanged
+    file memory-map the array (copy-on-write) without any text
+    parsing.  A changed source file is parsed again.  The array is
+    stored column by column (Fortran order), so that reading a few
+    named columns of a wide file (e.g. the muscles of one leg) only
+    touches those columns.
+
+    A time window (e.g. the GRF cycle plus padding) can be read
+    without parsing the whole file: a row-offset index (the time and
+    file position of each row, stored as a sidecar .idx.npy/.idx.json
+    next to the cache) is built once, the window is found by binary
+    search and only its rows are parsed.  If the whole file is already
+    cached, the window is sliced from the cached array instead.
+
+    The parsed (and cached) arrays are float64, or float32 with
+    dataType = np.float32 (e.g. for cohort analysis of muscle forces).
+    A float32 value is within a relative 6e-8 (2**-24) of the
+    float64 value, e.g. 0.3 mN for a muscle force of 5000 N or 6 us
+    for a time of 100 s.  Statistics (streamStats, rraMetrics,
+    processResults) are computed in float64, so that their error is
+    not larger than the error of the values.  Values interpolated in
+    time (e.g. the muscle forces over the cycle) also shift with the
+    rounded times, by up to the rate of change times the time error
+    (measured: 0.14 N for forces up to 5000 N changing at up to
+    50000 N/s, 0.1 ms steps at 98-100 s).  A cached array of the other
+    data type is parsed again.
+
+    Very long files (e.g. CMC states or raw EMG) can be streamed in
+    chunks of rows (iterStorage), with the column statistics
+    (streamStats) and the resampling to a time grid (streamResample)
+    computed incrementally, so that memory does not grow with the
+    length of the file.
+
+    A subject folder packed into a single archive (subjectArchive) is
+    read transparently: files found in the folder archive
+    (<folder>_Archive.h5 or .npz) are loaded from it, unless the file
+    itself has changed since.
+
+    Running the module compares the readers with np.loadtxt on the
+    CMC results of a trial.
+
+    Input:
+        Subject ID and trial name (benchmark)
+    Output:
+        Header, column names and data array
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Input                                            #
+#                                                                    #
+# ####################################################################
+# Subject ID and trial name (benchmark)
+subID = '20130221CONF'
+trialName = '20130221CONF_A_Walk_RepGRF'
+# ####################################################################
+
+
+# Imports
+import os
+import time
+import tempfile
+import json
+import hashlib
+import threading
+import warnings
+
+import numpy as np
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+
+# Sidecar cache of parsed files (local folder, or next to the source file if cacheDir is None)
+useCache = True
+cacheDir = os.path.join(tempfile.gettempdir(),'readResultsCache')
+
+# Open subject archives (archive path: modification time, file, index, member reader)
+archives = {}
+
+# Data type of the parsed arrays (np.float32 halves the memory and cache size, see above)
+dataType = np.float64
+
+# Numeric blocks are parsed with np.loadtxt on NumPy 1.23 and later (C
+# parser), otherwise with np.fromstring (np.loadtxt is a Python loop)
+useLoadtxt = tuple([int(v) for v in np.__version__.split('.')[:2]]) >= (1,23)
+
+# Rows per chunk of the streaming reader
+chunkRows = 10000
+
+# CMC result files (suffixes after the trial name) used by the benchmark
+benchmarkFiles = ['_CMC_Actuation_force.sto','_CMC_controls.sto','_CMC_Kinematics_q.sto',
+                  '_CMC_pErr.sto','_CMC_states.sto']
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def nextLine(text,pos):
+    """
+    Return the line of a text starting at a position and the position
+    of the following line.
+    """
+    end = text.find('\n',pos)
+    if end < 0:
+        end = len(text)
+    return text[pos:end].rstrip('\r'), end+1
+
+# ####################################################################
+
+def parseBlock(block,numColumns):
+    """
+    Parse a tab- or space-delimited numeric block into a (rows x
+    columns) float array.  Blank or non-numeric fields fall back to
+    np.genfromtxt (tab-delimited, NaN for blank fields).
+    """
+    # (Only blank lines are dropped -- trailing tab fields of a row are
+    # blank fields, e.g. missing markers in the last frame)
+    lines = [line.rstrip('\r') for line in block.split('\n') if line.strip()]
+    if len(lines) == 0:
+        return np.zeros((0,numColumns),dtype=dataType)
+    try:
+        if useLoadtxt:
+            values = np.loadtxt(lines,dtype=dataType,comments=None,ndmin=2)
+            if values.shape[1] == numColumns:
+                return values
+        else:
+            # (Warnings of incomplete parsing are raised as errors)
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                values = np.fromstring(block,dtype=dataType,sep=' ')
+            if values.size == len(lines)*numColumns:
+                return values.reshape(len(lines),numColumns)
+    except (ValueError,DeprecationWarning):
+        pass
+    # (Rows written without their trailing blank fields are padded)
+    numTabs = max([numColumns-1]+[line.count('\t') for line in lines])
+    lines = [line+'\t'*(numTabs-line.count('\t')) for line in lines]
+    data = np.genfromtxt(lines,delimiter='\t',dtype=dataType)
+    return np.ascontiguousarray(np.atleast_2d(data))
+
+# ####################################################################
+
+def getCachePaths(filePath,extension=''):
+    """
+    Return the paths of the sidecar array and header of a file (or of
+    its row-offset index, with extension '.idx').
+    """
+    if cacheDir is None:
+        basePath = filePath
+    else:
+        pathHash = hashlib.md5(os.path.abspath(filePath).encode('utf-8')).hexdigest()
+        basePath = os.path.join(cacheDir,pathHash+'_'+os.path.basename(filePath))
+    return basePath+extension+'.npy', basePath+extension+'.json'
+
+# ####################################################################
+
+def replaceFile(tempFilePath,filePath):
+    """
+    Move a temporary file over the target file.
+    """
+    if hasattr(os,'replace'):
+        os.replace(tempFilePath,filePath)
+    else:
+        # (Python 2 -- rename does not overwrite on Windows)
+        if os.path.exists(filePath):
+            os.remove(filePath)
+        os.rename(tempFilePath,filePath)
+
+# ####################################################################
+
+def loadSidecar(filePath,extension=''):
+    """
+    Return the header information and (memory-mapped) array of a
+    sidecar entry, or None if there is no up-to-date entry.
+    """
+    npyPath, jsonPath = getCachePaths(filePath,extension)
+    if not os.path.exists(jsonPath) or not os.path.exists(npyPath):
+        return None
+    try:
+        jsonFile = open(jsonPath,'r')
+        info = json.load(jsonFile)
+        jsonFile.close()
+        fileStat = os.stat(filePath)
+        if (info['source'] != os.path.abspath(filePath) or info['size'] != fileStat.st_size or
+            info['mtime'] != fileStat.st_mtime):
+            return None
+        data = np.load(npyPath,mmap_mode='c')
+    except (IOError,OSError,ValueError,KeyError):
+        return None
+    return info, data
+
+# ####################################################################
+
+def loadCached(filePath):
+    """
+    Return the cached header, names and (memory-mapped) data array of
+    a file, or None if there is no up-to-date cache entry.
+    """
+    cached = loadSidecar(filePath)
+    if cached is None:
+        return None
+    info, data = cached
+    # (Parsed with another data type)
+    if data.dtype != np.dtype(dataType):
+        return None
+    return info['header'], info['names'], data
+
+# ####################################################################
+
+def saveSidecar(filePath,fileStat,info,data,extension=''):
+    """
+    Write the sidecar array and header of a file (skipped if the
+    cache folder is not writable).  The header is written last, so that it
+    only exists for a complete entry.
+    """
+    npyPath, jsonPath = getCachePaths(filePath,extension)
+    info = dict(info)
+    info.update({'source': os.path.abspath(filePath),
+                 'size': fileStat.st_size,
+                 'mtime': fileStat.st_mtime})
+    try:
+        if cacheDir is not None and not os.path.isdir(cacheDir):
+            try:
+                os.makedirs(cacheDir)
+            except OSError:
+                # (Created by a concurrent reader)
+                if not os.path.isdir(cacheDir):
+                    raise
+        # (Temporary files per process and thread, for concurrent readers of a file)
+        tempSuffix = '.'+str(os.getpid())+'_'+str(threading.current_thread().ident)+'.tmp'
+        npyFile = open(npyPath+tempSuffix,'wb')
+        np.save(npyFile,np.asfortranarray(data))
+        npyFile.close()
+        replaceFile(npyPath+tempSuffix,npyPath)
+        jsonFile = open(jsonPath+tempSuffix,'w')
+        json.dump(info,jsonFile)
+        jsonFile.close()
+        replaceFile(jsonPath+tempSuffix,jsonPath)
+    except (IOError,OSError):
+        pass
+
+# ####################################################################
+
+def saveCached(filePath,fileStat,header,names,data):
+    """
+    Write the sidecar array and header of a parsed file.
+    """
+    saveSidecar(filePath,fileStat,{'header': header, 'names': names},data)
+
+# ####################################################################
+
+def getArchivePath(filePath):
+    """
+    Return the path of the archive of the folder containing a file
+    (folder name + '_Archive.h5' or '.npz'), or None if there is none.
+    """
+    folderPath = os.path.dirname(os.path.abspath(filePath))
+    basePath = os.path.join(folderPath,os.path.basename(folderPath)+'_Archive')
+    for extension in ['.h5','.npz']:
+        if os.path.exists(basePath+extension):
+            return basePath+extension
+    return None
+
+# ####################################################################
+
+def packIndex(index):
+    """
+    Encode the file index of an archive as an array of bytes (JSON),
+    stored as a member of the archive (HDF5 attributes are limited to
+    64 KB).
+    """
+    return np.frombuffer(json.dumps(index).encode('utf-8'),dtype=np.uint8)
+
+# ####################################################################
+
+def unpackIndex(member):
+    """
+    Decode the file index of an archive from its array of bytes.
+    """
+    return json.loads(np.asarray(member,dtype=np.uint8).tobytes().decode('utf-8'))
+
+# ####################################################################
+
+def openArchive(archivePath):
+    """
+    Return the index (file name: entry) and the member reader of an
+    archive.  Open archives are kept until the archive file changes.
+    """
+    archiveTime = os.stat(archivePath).st_mtime
+    if archivePath in archives and archives[archivePath][0] == archiveTime:
+        return archives[archivePath][2:]
+    if archivePath.endswith('.h5'):
+        if h5py is None:
+            raise ImportError('h5py is required to read '+archivePath)
+        archiveFile = h5py.File(archivePath,'r')
+        getMember = lambda key: archiveFile[key][...]
+    else:
+        archiveFile = np.load(archivePath)
+        getMember = lambda key: archiveFile[key]
+    index = unpackIndex(getMember('index'))
+    archives[archivePath] = (archiveTime,archiveFile,index,getMember)
+    return index, getMember
+
+# ####################################################################
+
+def loadArchived(filePath,withData=True):
+    """
+    Return the archived header, names and data array of a file (data
+    None if withData is False), or None if the folder has no archive
+    entry of the file.  An archived file that was changed since it was
+    archived is read from the file instead.
+    """
+    archivePath = getArchivePath(filePath)
+    if archivePath is None:
+        return None
+    index, getMember = openArchive(archivePath)
+    entry = index.get(os.path.basename(filePath))
+    if entry is None or 'data' not in entry:
+        return None
+    if os.path.exists(filePath):
+        fileStat = os.stat(filePath)
+        if entry['size'] != fileStat.st_size or entry['mtime'] != fileStat.st_mtime:
+            return None
+    if withData:
+        return entry['header'], entry['names'], getMember(entry['data']).astype(dataType,copy=False)
+    return entry['header'], entry['names'], None
+
+# ####################################################################
+
+def loadParsed(filePath):
+    """
+    Return the archived or cached header, names and data array of a
+    file, or None.
+    """
+    archived = loadArchived(filePath)
+    if archived is not None:
+        return archived
+    if useCache:
+        return loadCached(filePath)
+    return None
+
+# ####################################################################
+
+def readRaw(filePath):
+    """
+    Return the contents (bytes) of a file (e.g. a Setup file) from the
+    file or, if it is missing, from the archive of its folder.
+    """
+    if not os.path.exists(filePath):
+        archivePath = getArchivePath(filePath)
+        if archivePath is not None:
+            index, getMember = openArchive(archivePath)
+            entry = index.get(os.path.basename(filePath))
+            if entry is not None:
+                return getMember(entry['raw']).tobytes()
+    rawFile = open(filePath,'rb')
+    text = rawFile.read()
+    rawFile.close()
+    return text
+
+# ####################################################################
+
+def cachedRead(filePath,parser,cache=True):
+    """
+    Read a file with a parser, through the subject archive or the
+    sidecar cache (not for one-off files, e.g. in a sandbox folder,
+    with cache False).
+    """
+    archived = loadArchived(filePath)
+    if archived is not None:
+        return archived
+    if not (useCache and cache):
+        return parser(filePath)
+    cached = loadCached(filePath)
+    if cached is not None:
+        return cached
+    # (Source file state before parsing)
+    fileStat = os.stat(filePath)
+    header, names, data = parser(filePath)
+    saveCached(filePath,fileStat,header,names,data)
+    return header, names, data
+
+# ####################################################################
+
+def columnIndices(filePath,names,columns):
+    """
+    Return the names and indices of the named columns (in the given
+    order, names compared without surrounding whitespace).
+    """
+    strippedNames = [name.strip() for name in names]
+    missing = [name for name in columns if name.strip() not in strippedNames]
+    if len(missing) > 0:
+        raise ValueError(', '.join(missing)+' not found in '+filePath)
+    indices = [strippedNames.index(name.strip()) for name in columns]
+    return [names[k] for k in indices], indices
+
+# ####################################################################
+
+def selectColumns(filePath,names,data,columns):
+    """
+    Keep the named columns of a data array.  Returns the names and a
+    copy of the columns.
+    """
+    names, indices = columnIndices(filePath,names,columns)
+    return names, np.array(data[:,indices])
+
+# ####################################################################
+
+def readStorage(filePath,columns=None,timeRange=None,cache=True):
+    """
+    Read an OpenSim storage/motion file.  Returns the header lines,
+    the column names and the data array (blank fields become NaN).
+    With a list of column names, only those columns are kept.  With a
+    time range (start, end), only the rows within it are read.  With
+    cache False, the file is not added to the sidecar cache.
+    """
+    if timeRange is None:
+        headerLines, names, data = cachedRead(filePath,parseStorage,cache)
+    else:
+        headerLines, names, data = readWindow(filePath,timeRange)
+    if columns is not None:
+        names, data = selectColumns(filePath,names,data,columns)
+    return headerLines, names, data
+
+# ####################################################################
+
+def readTRC(filePath):
+    """
+    Read a marker (.trc) file.  Returns the header values, the marker
+    names and the data array (blank fields become NaN).
+    """
+    return cachedRead(filePath,parseTRC)
+
+# ####################################################################
+
+def splitHeader(text,filePath):
+    """
+    Split the header of a storage/motion file.  The column names
+    follow the 'endheader' line.  Without it (older motion files),
+    they are on the first line starting with 'time'.  Returns the
+    header lines, the column names, the number of columns and the
+    position of the data.
+    """
+    headerLines = []
+    numColumns = None
+    pos = 0
+    while pos < len(text):
+        line, nextPos = nextLine(text,pos)
+        if line.strip().lower() == 'endheader':
+            headerLines.append(line+'\n')
+            pos = nextPos
+            break
+        elif '=' in line:
+            key, value = line.split('=',1)
+            if key.strip().lower() in ['ncolumns','datacolumns']:
+                numColumns = int(value)
+        elif line.strip().lower().startswith('time'):
+            break
+        headerLines.append(line+'\n')
+        pos = nextPos
+    else:
+        raise ValueError('No column names found in '+filePath)
+    # Column names
+    line, pos = nextLine(text,pos)
+    names = line.rstrip().split('\t')
+    if numColumns is None:
+        numColumns = len(names)
+    return headerLines, names, numColumns, pos
+
+# ####################################################################
+
+def parseStorage(filePath):
+    """
+    Parse an OpenSim storage/motion file.
+    """
+    dataFile = open(filePath,'r')
+    text = dataFile.read()
+    dataFile.close()
+    headerLines, names, numColumns, pos = splitHeader(text,filePath)
+    return headerLines, names, parseBlock(text[pos:],numColumns)
+
+# ####################################################################
+
+def readStorageHeader(filePath):
+    """
+    Read the header lines and column names of a storage/motion file
+    without parsing the data (from the sidecar cache if it is up to
+    date, otherwise reading up to the column names only).
+    """
+    archived = loadArchived(filePath,False)
+    if archived is not None:
+        return archived[0], archived[1]
+    if useCache:
+        cached = loadCached(filePath)
+        if cached is not None:
+            return cached[0], cached[1]
+    dataFile = open(filePath,'r')
+    headerLines, names, numColumns = readHeaderLines(dataFile,filePath)
+    dataFile.close()
+    return headerLines, names
+
+# ####################################################################
+
+def readHeaderLines(dataFile,filePath):
+    """
+    Read the lines of an open storage/motion file up to (and
+    including) the column names.  Returns the header lines, the column
+    names and the number of columns.
+    """
+    lines = []
+    for line in dataFile:
+        lines.append(line)
+        # (Column names follow 'endheader' or start with 'time')
+        if len(lines) > 1 and lines[-2].strip().lower() == 'endheader':
+            break
+        elif line.strip().lower().startswith('time') and '=' not in line:
+            break
+    headerLines, names, numColumns, pos = splitHeader(''.join(lines),filePath)
+    return headerLines, names, numColumns
+
+# ####################################################################
+
+def iterStorage(filePath,columns=None,numRows=None):
+    """
+    Read a storage/motion file in chunks of rows.  Yields the column
+    names and a (rows x columns) array of up to numRows rows
+    (chunkRows by default, only the named columns with a list of
+    column names), so that memory does not grow with the length of
+    the file.  A cached file is read in chunks of the memory-mapped
+    array.
+    """
+    if numRows is None:
+        numRows = chunkRows
+    cached = loadParsed(filePath)
+    if cached is not None:
+        headerLines, names, data = cached
+        if columns is not None:
+            names, indices = columnIndices(filePath,names,columns)
+        else:
+            indices = slice(None)
+        for first in range(0,data.shape[0],numRows):
+            yield names, np.array(data[first:first+numRows,indices])
+        return
+    dataFile = open(filePath,'r')
+    try:
+        headerLines, names, numColumns = readHeaderLines(dataFile,filePath)
+        if columns is not None:
+            names, indices = columnIndices(filePath,names,columns)
+        lines = []
+        for line in dataFile:
+            if line.strip() != '':
+                lines.append(line)
+            if len(lines) == numRows:
+                chunk = parseBlock(''.join(lines),numColumns)
+                lines = []
+                if columns is not None:
+                    chunk = chunk[:,indices]
+                yield names, chunk
+        if len(lines) > 0:
+            chunk = parseBlock(''.join(lines),numColumns)
+            if columns is not None:
+                chunk = chunk[:,indices]
+            yield names, chunk
+    finally:
+        dataFile.close()
+
+# ####################################################################
+
+def streamStats(filePath,columns=None,numRows=None):
+    """
+    Compute the minimum, maximum, mean and RMS of each column of a
+    storage/motion file incrementally over chunks of rows.  Returns
+    the column names and arrays of the statistics.
+    """
+    names = []
+    totalRows = 0
+    for names, chunk in iterStorage(filePath,columns,numRows):
+        if totalRows == 0:
+            minValues = chunk.min(0)
+            maxValues = chunk.max(0)
+            sumValues = np.zeros(chunk.shape[1])
+            sumSquares = np.zeros(chunk.shape[1])
+        else:
+            minValues = np.minimum(minValues,chunk.min(0))
+            maxValues = np.maximum(maxValues,chunk.max(0))
+        sumValues += chunk.sum(0,dtype=float)
+        sumSquares += np.square(chunk,dtype=float).sum(0)
+        totalRows += chunk.shape[0]
+    if totalRows == 0:
+        raise ValueError('No data found in '+filePath)
+    return names, minValues, maxValues, sumValues/totalRows, np.sqrt(sumSquares/totalRows)
+
+# ####################################################################
+
+def streamResample(filePath,grid,columns=None,numRows=None):
+    """
+    Linearly interpolate the columns of a storage/motion file (time in
+    the first column) to a sorted time grid, incrementally over chunks
+    of rows (the last row of each chunk is kept to bridge to the
+    next).  As with np.interp, grid times outside of the data take the
+    first or last values.  Returns the column names (time first) and a
+    (grid x columns) array.
+    """
+    grid = np.asarray(grid,dtype=float)
+    if columns is not None:
+        columns = ['time']+[name for name in columns if name.strip() != 'time']
+    resampled = None
+    previous = None
+    first = 0
+    for names, chunk in iterStorage(filePath,columns,numRows):
+        if resampled is None:
+            resampled = np.empty((len(grid),chunk.shape[1]))
+        if previous is not None:
+            chunk = np.vstack([previous,chunk])
+        last = np.searchsorted(grid,chunk[-1,0],side='right')
+        for col in range(1,chunk.shape[1]):
+            resampled[first:last,col] = np.interp(grid[first:last],chunk[:,0],chunk[:,col])
+        first = last
+        previous = chunk[-1:]
+    if resampled is None:
+        raise ValueError('No data found in '+filePath)
+    # Grid times after the last row
+    resampled[first:,:] = previous
+    resampled[:,0] = grid
+    return names, resampled
+
+# ####################################################################
+
+def buildIndex(filePath):
+    """
+    Build the row-offset index of a storage/motion file.  Returns the
+    header lines, the column names, the number of columns and an array
+    of the row times and file positions (2 x rows+1, the last position
+    being the end of the file).
+    """
+    # (Binary read, so that positions are byte offsets)
+    dataFile = open(filePath,'rb')
+    text = dataFile.read()
+    dataFile.close()
+    if not isinstance(text,str):
+        text = text.decode('latin-1')
+    headerLines, names, numColumns, pos = splitHeader(text,filePath)
+    times = []
+    offsets = []
+    while pos < len(text):
+        line, nextPos = nextLine(text,pos)
+        if line.strip() != '':
+            times.append(float(line.split(None,1)[0]))
+            offsets.append(pos)
+        pos = nextPos
+    index = np.array([times+[np.inf],offsets+[len(text)]],dtype=float)
+    return headerLines, names, numColumns, index
+
+# ####################################################################
+
+def loadIndex(filePath):
+    """
+    Return the header lines, column names, number of columns and
+    row-offset index of a file, from its sidecar index if it is up to
+    date (otherwise the index is built and saved).
+    """
+    if useCache:
+        cached = loadSidecar(filePath,'.idx')
+        if cached is not None:
+            info, index = cached
+            return info['header'], info['names'], info['numColumns'], index
+    # (Source file state before indexing)
+    fileStat = os.stat(filePath)
+    headerLines, names, numColumns, index = buildIndex(filePath)
+    if useCache:
+        saveSidecar(filePath,fileStat,{'header': headerLines, 'names': names, 'numColumns': numColumns},
+                    index,'.idx')
+    return headerLines, names, numColumns, index
+
+# ####################################################################
+
+def readWindow(filePath,timeRange):
+    """
+    Read the rows of a storage/motion file with times within a time
+    range (start, end).  A cached file is sliced, otherwise only the
+    rows of the window are parsed (found in the row-offset index).
+    """
+    cached = loadParsed(filePath)
+    if cached is not None:
+        headerLines, names, data = cached
+        first = np.searchsorted(data[:,0],timeRange[0],side='left')
+        last = max(first,np.searchsorted(data[:,0],timeRange[1],side='right'))
+        return headerLines, names, data[first:last]
+    headerLines, names, numColumns, index = loadIndex(filePath)
+    first = np.searchsorted(index[0],timeRange[0],side='left')
+    last = max(first,np.searchsorted(index[0],timeRange[1],side='right'))
+    start = int(index[1,first])
+    end = int(index[1,last])
+    dataFile = open(filePath,'rb')
+    dataFile.seek(start)
+    block = dataFile.read(end-start)
+    dataFile.close()
+    if not isinstance(block,str):
+        block = block.decode('latin-1')
+    return headerLines, names, parseBlock(block,numColumns)
+
+# ####################################################################
+
+def parseTRC(filePath):
+    """
+    Parse a marker (.trc) file.
+    """
+    trcFile = open(filePath,'r')
+    text = trcFile.read()
+    trcFile.close()
+    # PathFileType line, header keys and values (DataRate, CameraRate, NumFrames, NumMarkers, ...)
+    line, pos = nextLine(text,0)
+    keys, pos = nextLine(text,pos)
+    values, pos = nextLine(text,pos)
+    header = dict(zip(keys.split('\t'),values.split('\t')))
+    # Marker names (every third column, after Frame# and Time) and X1 Y1 Z1 ... line
+    line, pos = nextLine(text,pos)
+    names = [name for name in line.split('\t')[2:] if name.strip() != '']
+    line, pos = nextLine(text,pos)
+    # Data (after any blank lines)
+    return header, names, parseBlock(text[pos:],2+3*len(names))
+
+# ####################################################################
+
+def benchmark(filePaths,numRepeats=3):
+    """
+    Print the best time of parseStorage, of a cached readStorage and
+    of np.loadtxt (with the header line count found by parseStorage)
+    for each file.
+    """
+    for filePath in filePaths:
+        if not os.path.exists(filePath):
+            print (filePath+' is missing.')
+            continue
+        # Fast reader
+        fastTimes = []
+        for k in range(numRepeats):
+            startTime = time.time()
+            headerLines, names, data = parseStorage(filePath)
+            fastTimes.append(time.time()-startTime)
+        # Cached (memory-mapped) reads
+        readStorage(filePath)
+        cachedTimes = []
+        for k in range(numRepeats):
+            startTime = time.time()
+            cachedData = readStorage(filePath)[2]
+            cachedTimes.append(time.time()-startTime)
+        # np.loadtxt
+        loadTimes = []
+        for k in range(numRepeats):
+            startTime = time.time()
+            loadData = np.loadtxt(filePath,skiprows=len(headerLines)+1)
+            loadTimes.append(time.time()-startTime)
+        match = (data.shape == loadData.shape and np.allclose(data,loadData,equal_nan=True) and
+                 np.array_equal(data,cachedData))
+        print (os.path.basename(filePath)+': '+str(data.shape[0])+' x '+str(data.shape[1])+', parseStorage '+
+               str(round(min(fastTimes),4))+' s, cached '+str(round(min(cachedTimes),4))+' s, np.loadtxt '+
+               str(round(min(loadTimes),4))+' s (same data: '+str(match)+')')
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    # Subject directory
+    nuDir = os.getcwd()
+    while os.path.basename(nuDir) != 'Northwestern-RIC':
+        nuDir = os.path.dirname(nuDir)
+    subDir = os.path.join(nuDir,'Modeling','OpenSim','Subjects',subID)+'\\'
+    # Compare with np.loadtxt
+    benchmark([subDir+trialName+fileSuffix for fileSuffix in benchmarkFiles])
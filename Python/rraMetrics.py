@@ -0,0 +1,184 @@
+"""
+----------------------------------------------------------------------
+    rraMetrics.py
+----------------------------------------------------------------------
+    This module computes the residual and position error metrics of
+    RRA (or CMC) results and the tiered score used to rate them (by
+    the genetic algorithm).  The locked coordinates (subtalar and mtp)
+    are left out of the position errors, translations are converted
+    from m to cm and rotations from rad to deg.
+
+    The statistics are computed column-wise, and the tiers are looked
+    up with np.digitize.  Both work on stacked arrays (e.g. trials x
+    columns), so that the metrics of many trials can be scored at
+    once (batchMetrics).
+
+    Input:
+        Results file prefix (e.g. subDir+trialName+'_RRA_')
+    Output:
+        Max, RMS and mean residuals and position errors, score
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# Imports
+import numpy as np
+
+from readResults import readStorage, readStorageHeader
+
+
+# Residual actuators
+residualNames = ['FX','FY','FZ','MX','MY','MZ']
+forceNames = ['FX','FY','FZ']
+momentNames = ['MX','MY','MZ']
+
+# Translational coordinates (m) -- all others are in rad
+translations = ['pelvis_tx','pelvis_ty','pelvis_tz']
+
+# Locked coordinates (not included in the position errors)
+lockedNames = ['subtalar_angle_r','mtp_angle_r','subtalar_angle_l','mtp_angle_l']
+
+# Score tiers: upper bounds and scores (a value up to the i-th bound
+# scores the i-th score, larger values score the last one)
+tiers = {'forceMax': ([10,25],[0.02,0.25,10]),
+         'forceRMS': ([5,10],[0.02,0.25,10]),
+         'momentMax': ([50,75],[0.02,0.25,10]),
+         'momentRMS': ([30,50],[0.02,0.25,10]),
+         'translationMax': ([2,5,15],[0.02,0.25,10,25]),
+         'translationRMS': ([2,4],[0.02,0.25,10]),
+         'rotationMax': ([2,5],[0.02,0.25,10]),
+         'rotationRMS': ([2,5],[0.02,0.25,10])}
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def columnStats(data):
+    """
+    Return the maximum absolute, RMS and mean values of each column
+    (over the rows -- the second to last axis).
+    """
+    data = np.asarray(data,dtype=float)
+    maxAbs = np.abs(data).max(-2)
+    rms = np.sqrt(np.mean(np.square(data),-2))
+    mean = data.mean(-2)
+    return maxAbs, rms, mean
+
+# ####################################################################
+
+def positionScale(posErrNames):
+    """
+    Return the unit conversion factors of the position errors (m to
+    cm for translations, rad to deg for rotations).
+    """
+    return np.array([100.0 if name in translations else 180/np.pi for name in posErrNames])
+
+# ####################################################################
+
+def readResiduals(filePath,cache=True):
+    """
+    Read the residual actuator forces and moments (FX-MZ) of an
+    Actuation_force file.  Returns the names and the data array.
+    """
+    headerList, names = readStorageHeader(filePath)
+    resNames = [name.strip() for name in names if name.strip() in residualNames]
+    headerList, names, data = readStorage(filePath,resNames,cache=cache)
+    return resNames, data
+
+# ####################################################################
+
+def readPosErrors(filePath,cache=True):
+    """
+    Read the position errors of a pErr file (without time and the
+    locked coordinates, in m or rad).  Returns the names and the data
+    array.
+    """
+    headerList, names = readStorageHeader(filePath)
+    posErrNames = [name.strip() for name in names[1:] if name.strip() not in lockedNames]
+    headerList, names, data = readStorage(filePath,posErrNames,cache=cache)
+    return posErrNames, data
+
+# ####################################################################
+
+def trialMetrics(filePrefix,cache=True):
+    """
+    Read the residuals and position errors of a trial (filePrefix +
+    'Actuation_force.sto' and 'pErr.sto').  Returns the residual
+    names with their max, RMS and mean values, and the coordinate
+    names with the max and RMS position errors (cm or deg).  With
+    cache False (one-off results), the files are not added to the
+    sidecar cache of readResults.
+    """
+    resNames, residuals = readResiduals(filePrefix+'Actuation_force.sto',cache)
+    maxResiduals, rmsResiduals, avgResiduals = columnStats(residuals)
+    posErrNames, posErrors = readPosErrors(filePrefix+'pErr.sto',cache)
+    maxPosErr, rmsPosErr, avgPosErr = columnStats(posErrors)
+    scale = positionScale(posErrNames)
+    return resNames, maxResiduals, rmsResiduals, avgResiduals, posErrNames, maxPosErr*scale, rmsPosErr*scale
+
+# ####################################################################
+
+def batchMetrics(filePrefixes):
+    """
+    Read the metrics of several trials (with the same columns) as
+    stacked arrays (trials x columns).
+    """
+    allMetrics = [trialMetrics(filePrefix) for filePrefix in filePrefixes]
+    resNames = allMetrics[0][0]
+    posErrNames = allMetrics[0][4]
+    for (filePrefix,metrics) in zip(filePrefixes,allMetrics):
+        if metrics[0] != resNames or metrics[4] != posErrNames:
+            raise ValueError('Columns of '+filePrefix+' do not match '+filePrefixes[0])
+    stacked = [np.array([metrics[k] for metrics in allMetrics]) for k in [1,2,3,5,6]]
+    return resNames, stacked[0], stacked[1], stacked[2], posErrNames, stacked[3], stacked[4]
+
+# ####################################################################
+
+def tierScore(values,tierName):
+    """
+    Look up the score of each value in the named tier table.
+    """
+    bounds, scores = tiers[tierName]
+    return np.asarray(scores)[np.digitize(values,bounds,right=True)]
+
+# ####################################################################
+
+def scoreResiduals(resNames,maxResiduals,rmsResiduals):
+    """
+    Return the tiered score of the max and RMS residuals (summed over
+    the last axis).
+    """
+    isForce = np.array([name in forceNames for name in resNames],dtype=bool)
+    isMoment = np.array([name in momentNames for name in resNames],dtype=bool)
+    maxResiduals = np.asarray(maxResiduals,dtype=float)
+    rmsResiduals = np.asarray(rmsResiduals,dtype=float)
+    scores = (isForce*(tierScore(maxResiduals,'forceMax')+tierScore(rmsResiduals,'forceRMS'))+
+              isMoment*(tierScore(maxResiduals,'momentMax')+tierScore(rmsResiduals,'momentRMS')))
+    return scores.sum(-1)
+
+# ####################################################################
+
+def scorePosErrors(posErrNames,maxPosErr,rmsPosErr):
+    """
+    Return the tiered score of the max and RMS position errors (cm or
+    deg, summed over the last axis).
+    """
+    isTranslation = np.array([name in translations for name in posErrNames],dtype=bool)
+    maxPosErr = np.asarray(maxPosErr,dtype=float)
+    rmsPosErr = np.asarray(rmsPosErr,dtype=float)
+    scores = np.where(isTranslation,tierScore(maxPosErr,'translationMax')+tierScore(rmsPosErr,'translationRMS'),
+                      tierScore(maxPosErr,'rotationMax')+tierScore(rmsPosErr,'rotationRMS'))
+    return scores.sum(-1)
+
+# ####################################################################
+
+def score(resNames,maxResiduals,rmsResiduals,posErrNames,maxPosErr,rmsPosErr):
+    """
+    Return the tiered score (lower is better) of the residuals and
+    position errors (cm or deg).  Stacked metrics give one score per
+    trial.
+    """
+    return scoreResiduals(resNames,maxResiduals,rmsResiduals)+scorePosErrors(posErrNames,maxPosErr,rmsPosErr)
@@ -1,383 +1,1128 @@
-"""
-----------------------------------------------------------------------
-    simpleGeneticAlgorithm.py
-----------------------------------------------------------------------
-    Doc...
-    
-----------------------------------------------------------------------
-    Created by Megan Schroeder
-    Last Modified 2013-07-08
-----------------------------------------------------------------------
-"""
-
-
-import random
-import numpy
-import linecache
-import os
-import time
-import subprocess
-from xml.dom.minidom import parse
-
-
-class simpleGA:
-    
-    def __init__(self):
-        self.populationSize = 8
-        self.chromosomeLength = 3
-        self.pCrossover = 0.8
-        self.pMutation = float(1)/float(self.populationSize*2)
-        self.maxGen = 300
-        self.variableValues = ['1','5','10','20','50','100','500','1000']
-        self.variableNames = ['pelvis_tz','pelvis_tx','pelvis_ty','pelvis_tilt','pelvis_list','pelvis_rotation',
-                              'hip_flexion_r','hip_adduction_r','hip_rotation_r','knee_angle_r','ankle_angle_r',
-                              'hip_flexion_l','hip_adduction_l','hip_rotation_l','knee_angle_l','ankle_angle_l',
-                              'lumbar_extension','lumbar_bending','lumbar_rotation']
-                              # subtalar_angle_r, mtp_angle_r, subtalar_angle_l, mtp_angle_l --> locked
-        self.numChromosomes = len(self.variableNames)
-        self.subDir = 'H:\\Northwestern-RIC\\Modeling\\OpenSim\\Subjects\\20130221CONF\\'
-        self.trialName = '20130221CONF_A_Walk_RepGRF'
-        self.log = self.subDir+self.trialName+'_RRA__GA.data'
-        self.summary = self.subDir+self.trialName+'_RRA__GA_Summary.log'
-
-    def createReport(self):
-        # Detailed report
-        logReport = []
-        header1 = ('Generation\tIndividual\tWeights'+'\t'*19+'Max Residual Force'+'\t'*3+'RMS Residual Force'+'\t'*3+'Max Residual Moment'+'\t'*3+'RMS Residual Moment'+'\t'*3+
-                   'Max Position Error (cm)'+'\t'*3+'RMS Position Error (cm)'+'\t'*3+'Max Position Error (deg)'+'\t'*16+'RMS Position Error (deg)'+'\t'*16+'Fitness\n')
-        logReport.append(header1)
-        header2 = '\t'.join(['','']+self.variableNames+['FX','FY','FZ']*2+['MX','MY','MZ']*2+self.variableNames[0:3]*2+self.variableNames[3:]*2+[''])+'\n'
-        logReport.append(header2)
-        # Write to file
-        logFile = open(self.log,'w')
-        logFile.writelines(logReport)
-        logFile.close()
-        # Summary report
-        summaryFile = open(self.summary,'w')
-        summaryFile.write('\t'.join(['Generation','Average Fitness','Max Fitness','Current Time'])+'\n')
-        summaryFile.close()
-
-    def initializePopulation(self):
-        self.currentGen = 0
-        gen0 = []
-        for i in range(self.populationSize):
-            parent = ''
-            for j in range(self.numChromosomes):
-                for k in range(self.chromosomeLength):
-                    parent += random.choice(['0','1'])
-                parent += '-'
-            parent = parent.rstrip('-')
-            gen0.append(parent)
-        return gen0
-
-    def decode(self,chromosome):
-        # Decode a binary string into an integer
-        intValue = 0
-        numAlleles = range(self.chromosomeLength)
-        numAlleles.reverse()
-        for i in numAlleles:
-            if chromosome[i] == '1':
-                intValue = intValue+2**i
-        return intValue
-
-    def calculateFitness(self,population):
-        rraCMCTaskSetFilePath = 'H:\\Northwestern-RIC\\Modeling\\OpenSim\\GenericFiles\\gait2392_RRA_CMCTaskSet.xml'
-        dom = parse(rraCMCTaskSetFilePath)
-        cmcJointElements = dom.getElementsByTagName('CMC_Joint')
-        fitnesses = []
-        logReport = []
-        for individual in population:
-            logReportLine = [str(self.currentGen),str(population.index(individual)+1)]
-            chromosomes = individual.split('-')
-            # Write weights to XML
-            for i in range(len(chromosomes)):
-                index = self.decode(chromosomes[i])
-                value = self.variableValues[index]
-                name = self.variableNames[i]
-                logReportLine.append(value)
-                for elem in cmcJointElements:
-                    if elem.getAttribute('name') == name:
-                        elem.getElementsByTagName('weight')[0].firstChild.nodeValue = ' '+value
-                        break
-            xmlString = dom.toxml('UTF-8')
-            xmlFile = open(rraCMCTaskSetFilePath,'w')
-            xmlFile.write(xmlString)
-            xmlFile.close()
-            # Specify trial
-            subDir = self.subDir
-            trialName = self.trialName
-            # Run simulation
-            subprocess.Popen((subDir+'Run.bat'), shell=True, cwd=subDir)
-            startTime = time.time()
-            while True:
-                # Check for simulation result file
-                if os.access(subDir+trialName+'_RRA_controls.xml',os.F_OK):
-                    break
-                # Timeout after 2 minutes if file doesn't exist yet (simulation probably failed)
-                elif (time.time()-startTime) > 120:
-                    break
-                # Wait
-                else:
-                    time.sleep(5)
-            # Process simulation output
-            try:
-                weightSum = 0
-                # Residuals
-                txtline = linecache.getline(subDir+trialName+'_RRA_Actuation_force.sto',23)
-                headerList = txtline.rstrip().split('\t')
-                residualNames = headerList[1:7]
-                linecache.clearcache()
-                residuals = numpy.loadtxt(subDir+trialName+'_RRA_Actuation_force.sto',skiprows=23,usecols=(1,2,3,4,5,6))
-                maxResiduals = residuals.__abs__().max(0)
-                rmsResiduals = numpy.sqrt(numpy.sum(numpy.square(residuals),0)/numpy.size(residuals,0))
-                ###residuals = numpy.genfromtxt(subDir+trialName+'_RRA_Actuation_force.sto',dtype=float,skip_header=22,usecols=(1,2,3,4,5,6),names=True)
-                ###residualNames = residuals.dtype.names
-                ###residualsArray = residuals.view((float, len(residuals.dtype.names)))
-                for k in range(len(residualNames)):
-                    if residualNames[k] == 'FX' or residualNames[k] == 'FY' or residualNames[k] == 'FZ':
-                        # Max
-                        if maxResiduals[k] <= 10:
-                            weightSum+=0.02
-                        elif maxResiduals[k] <= 25:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                        # RMS
-                        if rmsResiduals[k] <= 5:
-                            weightSum+=0.02
-                        elif rmsResiduals[k] <= 10:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                    elif residualNames[k] == 'MX' or residualNames[k] == 'MY' or residualNames[k] == 'MZ':
-                        # Max
-                        if maxResiduals[k] <= 50:
-                            weightSum+=0.02
-                        elif maxResiduals[k] <= 75:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                        # RMS
-                        if rmsResiduals[k] <= 30:
-                            weightSum+=0.02
-                        elif rmsResiduals[k] <= 50:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                # Position Errors
-                txtline = linecache.getline(subDir+trialName+'_RRA_pErr.sto',7)
-                headerList = txtline.rstrip().split('\t')
-                posErrNames = headerList[1:]
-                linecache.clearcache()
-                # (Column indices to remove -- after removing first column)
-                removeIndices = [posErrNames.index('subtalar_angle_r'),posErrNames.index('mtp_angle_r'),posErrNames.index('subtalar_angle_l'),posErrNames.index('mtp_angle_l')]
-                removeIndices.reverse()
-                for k in removeIndices:
-                    del posErrNames[k]
-                posErrors = numpy.loadtxt(subDir+trialName+'_RRA_pErr.sto',skiprows=7)
-                posErrors = numpy.delete(posErrors,0,1)
-                for k in removeIndices:
-                    posErrors = numpy.delete(posErrors,k,1)
-                maxPosErr = posErrors.__abs__().max(0)
-                rmsPosErr = numpy.sqrt(numpy.sum(numpy.square(posErrors),0)/numpy.size(posErrors,0))
-                for k in range(len(posErrNames)):
-                    if posErrNames[k] == 'pelivs_tx' or posErrNames[k] == 'pelvis_ty' or posErrNames[k] == 'pelvis_tz':
-                        # Convert from m to cm
-                        maxPosErr[k]*=100
-                        rmsPosErr[k]*=100
-                        # Max
-                        if maxPosErr[k] <= 2:
-                            weightSum+=0.02
-                        elif maxPosErr[k] <= 5:
-                            weightSum+=0.25
-                        elif maxPosErr[k] <= 15:
-                            weightSum+=10
-                        else:
-                            weightSum+=25
-                        # RMS
-                        if rmsPosErr[k] <= 2:
-                            weightSum+=0.02
-                        elif rmsPosErr[k] <= 4:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                    else:
-                        # Convert from rad to deg
-                        maxPosErr[k]*=180/numpy.pi
-                        rmsPosErr[k]*=180/numpy.pi
-                        # Max
-                        if maxPosErr[k] <= 2:
-                            weightSum+=0.02
-                        elif maxPosErr[k] <= 5:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                        # RMS
-                        if rmsPosErr[k] <= 2:
-                            weightSum+=0.02
-                        elif rmsPosErr[k] <= 5:
-                            weightSum+=0.25
-                        else:
-                            weightSum+=10
-                # Update log
-                maxResiduals = maxResiduals.tolist()
-                rmsResiduals = rmsResiduals.tolist()
-                maxPosErr = maxPosErr.tolist()
-                rmsPosErr = rmsPosErr.tolist()
-                # FX, FY, FZ
-                for k in range(3): logReportLine.append(str(maxResiduals[k]))
-                for k in range(3): logReportLine.append(str(rmsResiduals[k]))
-                # MX, MY, MZ
-                for k in range(3,6): logReportLine.append(str(maxResiduals[k]))
-                for k in range(3,6): logReportLine.append(str(rmsResiduals[k]))
-                # Translations
-                for k in range(3): logReportLine.append(str(maxPosErr[k]))
-                for k in range(3): logReportLine.append(str(rmsPosErr[k]))
-                # Angles
-                for k in range(3,len(maxPosErr)): logReportLine.append(str(maxPosErr[k]))
-                for k in range(3,len(rmsPosErr)): logReportLine.append(str(rmsPosErr[k]))
-                # Individual fitness
-                fitnesses.append(1/weightSum)
-                logReportLine.append(str(1/weightSum))
-                # Remove simulation output files
-                try:
-                    os.remove(subDir+trialName+'_RRA.log')
-                    os.remove(subDir+trialName+'_AdjustedCOM.osim')
-                    os.remove(subDir+'err.log')
-                    os.remove(subDir+'out.log')
-                except:
-                    pass
-                rraSpecifiers = ('Actuation_force.sto','Actuation_power.sto','Actuation_speed.sto',
-                                 'BodyKinematics_acc_global.sto','BodyKinematics_pos_global.sto','BodyKinematics_vel_global.sto',
-                                 'Kinematics_dudt.sto','Kinematics_q.sto','Kinematics_u.sto',
-                                 'avgResiduals.txt','controls.sto','controls.xml','pErr.sto','states.sto')
-                for fspec in rraSpecifiers:
-                    try:
-                        os.remove(subDir+trialName+'_RRA_'+fspec)
-                    except:
-                        break
-            # If simulation failed
-            except:
-                fitnesses.append(0.0000000001)
-            # Append to log
-            logReport.append('\t'.join(logReportLine)+'\n')                        
-        # Write to output file
-        logFile = open(self.log,'a')
-        logFile.writelines(logReport)
-        logFile.close()
-        # Summary
-        summaryFile = open(self.summary,'a')
-        summaryFile.write('\t'.join([str(self.currentGen),str(numpy.mean(fitnesses)),str(numpy.max(fitnesses)),time.strftime('%H:%M:%S',time.localtime())])+'\n')
-        summaryFile.close()
-        # Print to screen
-        print ('Generation '+str(self.currentGen)+' is complete. Max fitness is '+str(numpy.max(fitnesses))+'.')
-        # Return
-        return fitnesses
-
-    def rouletteSelect(self,origPopulation,fitnesses):
-        totalFitness = float(sum(fitnesses))
-        relFitness = [f/totalFitness for f in fitnesses]
-        probIntervals = [sum(relFitness[:i+1]) for i in range(len(relFitness))]
-        newPopulation = []
-        for j in range(len(origPopulation)):
-            r = random.random()
-            for (i,individual) in enumerate(origPopulation):
-                if r <= probIntervals[i]:
-                    newPopulation.append(individual)
-                    break
-        return newPopulation
-
-    def crossover(self,origPopulation):
-        parentIndices = range(self.populationSize)
-        # Reorder parents randomly
-        random.shuffle(parentIndices)
-        # Initialize loop
-        i = 0
-        newPopulation = []
-        while i <= self.populationSize-2:
-            # Operate on pairs
-            mate1 = origPopulation[i].split('-')
-            mate2 = origPopulation[i+1].split('-')
-            child1 = []
-            child2 = []
-            # Loop through chromosomes
-            for j in range(self.numChromosomes):
-                # Check if pair will crossover (based on crossover probability)
-                if random.random() <= self.pCrossover:
-                    # Determine crossover location
-                    x = random.choice(range(1,self.chromosomeLength))
-                    # Crossover
-                    child1.append(mate1[j][:x]+mate2[j][x:])
-                    child2.append(mate2[j][:x]+mate1[j][x:])
-                else:
-                    child1.append(mate1[j])
-                    child2.append(mate2[j])
-            # Append to new population
-            newPopulation.append('-'.join(child1))
-            newPopulation.append('-'.join(child2))
-            # Increment (by 2)
-            i+=2
-        return newPopulation
-
-    def mutation(self,origPopulation):
-        newPopulation = []
-        # Loop through individuals
-        for parent in origPopulation:
-            chromosomeList = parent.split('-')
-            child = []
-            # Loop through chromosomes
-            for chromosome in chromosomeList:
-                # Check if mutation will occur (based on mutation probability)
-                if random.random() <= self.pMutation:
-                    # Determine mutation location
-                    x = random.choice(range(self.chromosomeLength))
-                    # Mutation
-                    alleles = list(chromosome)
-                    if alleles[x] == '1':
-                        alleles[x] = '0'
-                    elif alleles[x] == '0':
-                        alleles[x] = '1'
-                    # New chromosome
-                    child.append(''.join(alleles))
-                else:
-                    child.append(chromosome)
-            # New population
-            newPopulation.append('-'.join(child))
-        return newPopulation
-
-    def generation(self,origPopulation,origFitnesses):
-        # Create a new generation through select, crossover, and mutation
-        selectPopulation = self.rouletteSelect(origPopulation,origFitnesses)
-        crossoverPopulation = self.crossover(selectPopulation)
-        newPopulation = self.mutation(crossoverPopulation)
-        # Increment new population
-        self.currentGen+=1
-        # Calculate fitness of new generation
-        newFitnesses = self.calculateFitness(newPopulation)
-        return newPopulation,newFitnesses
-
-    def run(self):
-        # Initialize log report
-        self.createReport()
-        # Create new population
-        genN = self.initializePopulation()
-        fitnesses = self.calculateFitness(genN)
-        # Initialize loop
-        n = 1
-        while n <= self.maxGen:
-            if max(fitnesses) < 1:
-                # Create a new generation
-                genN,fitnesses = self.generation(genN,fitnesses)
-                # Increment
-                n+=1
-            else:
-                break
-
-# ******************************************************************************
-
-if __name__ == '__main__':
-    # Create instance of class
-    sga = simpleGA()
-    # Run code
-    sga.run()
-
+"""
+----------------------------------------------------------------------
+    simpleGeneticAlgorithm.py
+----------------------------------------------------------------------
+    Doc...
+
+    Each individual is evaluated in its own sandbox folder (private
+    copies of the RRA Setup and task set files), so that a population
+    can be evaluated by several worker processes at once.  The results
+    do not depend on the number of workers.
+
+    The metrics of every simulated weight vector are stored in a
+    persistent cache (_RRA__GA_Cache.data), keyed by the weights and
+    by hashes of the trial inputs and of the model files.  Repeated
+    weight vectors (within a run or across runs) are not simulated
+    again.  The cache hit rate of each generation is written to the
+    summary log.
+
+    The population is held as a bit matrix (NumPy uint8 array with one
+    row per individual and chromosomeLength bits per variable).
+    Selection uses the cumulative fitness and searchsorted, and
+    crossover and mutation are applied with vectorized bit masks.
+
+    Optionally, a k-nearest-neighbour surrogate (trained on the cached
+    weight vectors and their fitnesses) ranks the offspring that have
+    not been simulated yet.  Only the most promising fraction (plus a
+    random share of the others, for exploration) is simulated; the
+    others keep their predicted fitness.  The accuracy of the surrogate
+    on the simulated offspring is written to _RRA__GA_Surrogate.log.
+
+    After every generation the population, fitnesses, generation
+    number, random number generator state, cache entries and log file
+    sizes are written to a checkpoint (_RRA__GA_Checkpoint.pkl, via a
+    temporary file and a rename).  run(resume=True) continues an
+    interrupted run from the last checkpoint.  The checkpoint is
+    removed when a run finishes, so the next run starts from scratch.
+
+    In the steady-state mode (mode = 'steady-state') there are no
+    generations: every worker that finishes immediately gets a new
+    candidate, and the candidate replaces the worst individual of the
+    population if it is better.  Candidates come from the GA operators
+    (sampler = 'ga') or from a diagonal CMA-ES (sampler = 'cmaes') over
+    the log10 weights, snapped to the nearest allowed weight.  Every
+    populationSize evaluations count as one generation in the logs and
+    checkpoints.
+
+    The fitness can be evaluated on a list of trials (trialNames, any
+    subjects and tasks), with all trials of all individuals simulated
+    concurrently.  The tiered scores of the trials are combined by
+    their mean or by the worst trial (combine = 'mean' or 'worst').
+    Each trial has its own cache (in its subject folder), so adding a
+    trial does not invalidate earlier evaluations.
+
+    With early termination (earlyTermination = True), every RRA run
+    gets the score it needs to beat the worst fitness kept so far (the
+    worst of the parent generation, or of the steady-state population).
+    The partially written result files are monitored during the run,
+    and a run whose score bound already exceeds it is stopped.  Its
+    fitness is the (upper) bound, which is logged but not cached.
+
+    Every evaluation of a trial is recorded in _RRA__GA_Timing.log:
+    its source (simulation, cache, surrogate, stopped or failed), the
+    worker process, the time spent waiting in the pool queue and the
+    simulation wall time.  The summary log adds the number of
+    simulations, the utilization of the workers (simulation time over
+    workers x wall time since the previous generation) and the
+    evaluations per hour of each generation.
+----------------------------------------------------------------------
+    Created by Megan Schroeder
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+import numpy
+import os
+import time
+import shutil
+import hashlib
+import pickle
+try:
+    import queue
+except ImportError:
+    import Queue as queue
+import subprocess
+import signal
+from multiprocessing import Pool
+from xml.dom.minidom import parse
+
+from outputProfiles import applyOutputProfile
+import rraMetrics
+
+
+class storageMonitor:
+    """
+    Incremental reader of a Storage (.sto) file that is still being
+    written.  Every update reads the complete rows added since the
+    last update and keeps the maximum absolute value of each column.
+    """
+
+    def __init__(self,filePath):
+        """
+        Create an instance of the class from the file path.
+        """
+        self.filePath = filePath
+        self.position = 0
+        self.inHeader = True
+        self.partialLine = ''
+        self.names = None
+        self.maxAbs = None
+
+    """------------------------------------------------------------"""
+    def update(self):
+        """
+        Read the rows added to the file since the last update.
+        """
+        if not os.path.exists(self.filePath):
+            return
+        stoFile = open(self.filePath,'r')
+        stoFile.seek(self.position)
+        text = stoFile.read()
+        self.position = stoFile.tell()
+        stoFile.close()
+        # (The last line may not be complete yet)
+        lines = (self.partialLine+text).split('\n')
+        self.partialLine = lines.pop()
+        rows = []
+        for line in lines:
+            # (Column names follow the endheader line)
+            if self.inHeader:
+                self.inHeader = line.strip() != 'endheader'
+            elif self.names is None:
+                self.names = line.rstrip().split('\t')
+            elif line.strip():
+                rows.append(line.split())
+        if len(rows) > 0:
+            data = numpy.array(rows,dtype=float)
+            maxAbs = numpy.abs(data).max(0)
+            if self.maxAbs is None:
+                self.maxAbs = maxAbs
+            else:
+                self.maxAbs = numpy.maximum(self.maxAbs,maxAbs)
+
+
+def scoreBound(actuationMonitor,pErrMonitor):
+    """
+    Lower bound of the tiered score of a simulation that is still
+    running, from the maxima of the rows written so far (the maxima
+    can only grow).  The RMS values are not bounded -- the number of
+    rows of a variable-step integrator is not known in advance -- so
+    their tiers are counted as the best.
+    """
+    residualNames = []
+    maxResiduals = []
+    rmsResiduals = []
+    posErrNames = []
+    maxPosErr = []
+    rmsPosErr = []
+    if actuationMonitor.maxAbs is not None:
+        residualNames = actuationMonitor.names[1:7]
+        maxResiduals = actuationMonitor.maxAbs[1:7].tolist()
+        rmsResiduals = [0.0]*len(maxResiduals)
+    if pErrMonitor.maxAbs is not None:
+        for (name,maxValue) in zip(pErrMonitor.names[1:],pErrMonitor.maxAbs[1:]):
+            if name not in rraMetrics.lockedNames:
+                posErrNames.append(name)
+                maxPosErr.append(maxValue)
+                rmsPosErr.append(0.0)
+    weightSum,maxPosErr,rmsPosErr = scoreMetrics((residualNames,maxResiduals,rmsResiduals,posErrNames,maxPosErr,rmsPosErr))
+    return weightSum
+
+
+def killProcess(proc):
+    """
+    Stop a simulation together with the shell that started it.
+    """
+    if os.name == 'nt':
+        devNull = open(os.devnull,'w')
+        subprocess.call('taskkill /F /T /PID '+str(proc.pid),shell=True,stdout=devNull,stderr=devNull)
+        devNull.close()
+    else:
+        try:
+            os.killpg(proc.pid,signal.SIGKILL)
+        except OSError:
+            pass
+    proc.wait()
+
+
+def evaluateWeights(task):
+    """
+    Picklable function for running RRA for one individual in its own
+    sandbox folder.  Returns the residual and position error metrics
+    (None if the simulation failed).
+
+    If a maximum score is given, the partially written Actuation force
+    and position error files are monitored while RRA runs.  As soon as
+    the lower bound of the score exceeds the maximum, the simulation
+    is stopped and the bound (a float) is returned instead of the
+    metrics.
+    """
+    sandboxDir, trialName, setupFilePath, outputProfile, weights, maxWeightSum = task
+    # Create (empty) sandbox folder
+    if os.path.exists(sandboxDir):
+        shutil.rmtree(sandboxDir)
+    os.makedirs(sandboxDir)
+    # Private copy of the task set with the individual's weights
+    setupDom = parse(setupFilePath)
+    taskSetFilePath = setupDom.getElementsByTagName('task_set_file')[0].firstChild.nodeValue.strip()
+    taskSetFilePath = os.path.join(os.path.dirname(setupFilePath),taskSetFilePath)
+    dom = parse(taskSetFilePath)
+    cmcJointElements = dom.getElementsByTagName('CMC_Joint')
+    for (name,value) in weights:
+        for elem in cmcJointElements:
+            if elem.getAttribute('name') == name:
+                elem.getElementsByTagName('weight')[0].firstChild.nodeValue = ' '+value
+                break
+    xmlFile = open(sandboxDir+'TaskSet.xml','wb')
+    xmlFile.write(dom.toxml('UTF-8'))
+    xmlFile.close()
+    # Private copy of the Setup file writing to the sandbox
+    setupDom.getElementsByTagName('task_set_file')[0].firstChild.nodeValue = ' '+sandboxDir+'TaskSet.xml '
+    setupDom.getElementsByTagName('results_directory')[0].firstChild.nodeValue = ' '+sandboxDir+' '
+    setupDom.getElementsByTagName('output_model_file')[0].firstChild.nodeValue = ' '+sandboxDir+trialName+'__AdjustedCOM.osim '
+    applyOutputProfile(setupDom,'RRA',outputProfile)
+    xmlFile = open(sandboxDir+'Setup_RRA.xml','wb')
+    xmlFile.write(setupDom.toxml('UTF-8'))
+    xmlFile.close()
+    # Run simulation
+    # (In its own process group on Linux, so that it can be stopped with the shell)
+    if os.name == 'nt':
+        proc = subprocess.Popen(('rra -S Setup_RRA.xml > '+sandboxDir+trialName+'_RRA.log'), shell=True, cwd=sandboxDir)
+    else:
+        proc = subprocess.Popen(('rra -S Setup_RRA.xml > '+sandboxDir+trialName+'_RRA.log'), shell=True, cwd=sandboxDir, preexec_fn=os.setsid)
+    startTime = time.time()
+    actuationMonitor = storageMonitor(sandboxDir+trialName+'_RRA_Actuation_force.sto')
+    pErrMonitor = storageMonitor(sandboxDir+trialName+'_RRA_pErr.sto')
+    while True:
+        # (Checked before the result file, so that a late result is not missed)
+        finished = proc.poll() is not None
+        # Check for simulation result file
+        if os.access(sandboxDir+trialName+'_RRA_controls.xml',os.F_OK):
+            proc.wait()
+            break
+        # Simulation ended without results or timeout after 2 minutes (simulation probably failed)
+        elif finished or (time.time()-startTime) > 120:
+            # (Stop the shell and RRA, which may still write to the sandbox)
+            killProcess(proc)
+            return None
+        # Stop a simulation that cannot beat the maximum score
+        elif maxWeightSum is not None:
+            actuationMonitor.update()
+            pErrMonitor.update()
+            weightSum = scoreBound(actuationMonitor,pErrMonitor)
+            if weightSum > maxWeightSum:
+                killProcess(proc)
+                shutil.rmtree(sandboxDir,ignore_errors=True)
+                return float(weightSum)
+            time.sleep(1)
+        # Wait
+        else:
+            time.sleep(1)
+    # Process simulation output
+    try:
+        # Residuals (sandbox files are not cached)
+        residualNames, residuals = rraMetrics.readResiduals(sandboxDir+trialName+'_RRA_Actuation_force.sto',cache=False)
+        maxResiduals, rmsResiduals, avgResiduals = rraMetrics.columnStats(residuals)
+        # Position Errors (without the locked coordinates)
+        posErrNames, posErrors = rraMetrics.readPosErrors(sandboxDir+trialName+'_RRA_pErr.sto',cache=False)
+        maxPosErr, rmsPosErr, avgPosErr = rraMetrics.columnStats(posErrors)
+    except:
+        return None
+    # Remove sandbox (kept for inspection if the simulation failed)
+    shutil.rmtree(sandboxDir,ignore_errors=True)
+    return (residualNames,maxResiduals.tolist(),rmsResiduals.tolist(),posErrNames,maxPosErr.tolist(),rmsPosErr.tolist())
+
+
+def scoreMetrics(metrics):
+    """
+    Tiered score (weight sum, lower is better) of the residuals and
+    position errors.  Returns the score with the position errors
+    converted to cm / deg.
+    """
+    residualNames, maxResiduals, rmsResiduals, posErrNames, maxPosErr, rmsPosErr = metrics
+    scale = rraMetrics.positionScale(posErrNames)
+    maxPosErr = numpy.array(maxPosErr,dtype=float)*scale
+    rmsPosErr = numpy.array(rmsPosErr,dtype=float)*scale
+    weightSum = float(rraMetrics.score(residualNames,maxResiduals,rmsResiduals,posErrNames,maxPosErr,rmsPosErr))
+    return weightSum,maxPosErr.tolist(),rmsPosErr.tolist()
+
+
+def evaluateJob(job):
+    """
+    Picklable function for evaluating one sandbox task.  Returns the
+    job ID with the metrics, and the worker process ID with the start
+    and end times of the evaluation.
+    """
+    jobID, task = job
+    startTime = time.time()
+    try:
+        result = evaluateWeights(task)
+    except:
+        result = None
+    return jobID,result,(os.getpid(),startTime,time.time())
+
+
+def hashFiles(filePaths):
+    """
+    Return the MD5 hash of the contents of a list of files (the name
+    is hashed for a missing file).
+    """
+    md5 = hashlib.md5()
+    for filePath in filePaths:
+        if not os.path.exists(filePath):
+            md5.update(filePath.encode('utf-8'))
+            continue
+        dataFile = open(filePath,'rb')
+        md5.update(dataFile.read())
+        dataFile.close()
+    return md5.hexdigest()
+
+
+def knnPredict(trainX,trainY,X,k):
+    """
+    Predict the values at the points X (rows) by inverse-distance
+    weighting of the k nearest training points.
+    """
+    k = min(k,len(trainX))
+    # Distances (points x training points)
+    dist = numpy.sqrt(numpy.square(X[:,numpy.newaxis,:]-trainX[numpy.newaxis,:,:]).sum(2))
+    nearest = numpy.argsort(dist,axis=1)[:,:k]
+    nearestDist = dist[numpy.arange(len(X))[:,numpy.newaxis],nearest]
+    weights = 1/(nearestDist+1e-6)
+    return (weights*trainY[nearest]).sum(1)/weights.sum(1)
+
+
+class diagonalCMA:
+    """
+    A CMA-ES sampler with a diagonal covariance matrix (separable
+    CMA-ES).  Results may be reported in any order; the distribution
+    is updated from every block of lambda reported candidates.
+    """
+
+    def __init__(self,mean,sigma,numOffspring,randState):
+        """
+        Create an instance of the class from the initial mean, step
+        size and number of offspring per update (lambda).
+        """
+        n = len(mean)
+        self.mean = numpy.array(mean,dtype=float)
+        self.sigma = float(sigma)
+        self.diagC = numpy.ones(n)
+        self.ps = numpy.zeros(n)
+        self.pc = numpy.zeros(n)
+        self.randState = randState
+        # Recombination weights
+        self.numOffspring = numOffspring
+        self.numParents = numOffspring//2
+        weights = numpy.log(self.numParents+0.5)-numpy.log(numpy.arange(1,self.numParents+1))
+        self.weights = weights/weights.sum()
+        self.mueff = 1/numpy.sum(numpy.square(self.weights))
+        # Learning rates (covariance rates scaled by (n+2)/3 for the diagonal model)
+        self.cs = (self.mueff+2)/(n+self.mueff+5)
+        self.ds = 1+2*max(0,numpy.sqrt((self.mueff-1)/(n+1))-1)+self.cs
+        self.cc = 4.0/(n+4)
+        self.c1 = min(1,2/((n+1.3)**2+self.mueff)*(n+2)/3.0)
+        self.cmu = min(1-self.c1,2*(self.mueff-2+1/self.mueff)/((n+2)**2+self.mueff)*(n+2)/3.0)
+        self.chiN = numpy.sqrt(n)*(1-1/(4.0*n)+1/(21.0*n**2))
+        self.numUpdates = 0
+        # Reported candidates since the last update
+        self.reported = []
+
+    """------------------------------------------------------------"""
+    def sample(self):
+        """
+        Draw a candidate from the current distribution.
+        """
+        z = self.randState.standard_normal(len(self.mean))
+        return self.mean+self.sigma*numpy.sqrt(self.diagC)*z
+
+    """------------------------------------------------------------"""
+    def tell(self,x,fitness):
+        """
+        Report the fitness of a candidate (higher is better).
+        """
+        self.reported.append((fitness,x))
+        if len(self.reported) >= self.numOffspring:
+            self.update()
+
+    """------------------------------------------------------------"""
+    def update(self):
+        """
+        Update the mean, evolution paths, covariance and step size from
+        the best reported candidates.
+        """
+        self.reported.sort(key=lambda pair: -pair[0])
+        y = numpy.array([x for (fitness,x) in self.reported[:self.numParents]])-self.mean
+        y /= self.sigma
+        yw = numpy.dot(self.weights,y)
+        # Mean
+        self.mean = self.mean+self.sigma*yw
+        # Evolution paths
+        self.ps = (1-self.cs)*self.ps+numpy.sqrt(self.cs*(2-self.cs)*self.mueff)*yw/numpy.sqrt(self.diagC)
+        self.numUpdates+=1
+        hsig = numpy.linalg.norm(self.ps)/numpy.sqrt(1-(1-self.cs)**(2*self.numUpdates)) < (1.4+2/(len(self.mean)+1.0))*self.chiN
+        self.pc = (1-self.cc)*self.pc+hsig*numpy.sqrt(self.cc*(2-self.cc)*self.mueff)*yw
+        # Covariance (rank-one and rank-mu updates)
+        self.diagC = (1-self.c1-self.cmu)*self.diagC+self.c1*numpy.square(self.pc)+self.cmu*numpy.dot(self.weights,numpy.square(y))
+        # Step size
+        self.sigma *= numpy.exp(self.cs/self.ds*(numpy.linalg.norm(self.ps)/self.chiN-1))
+        self.reported = []
+
+
+class fitnessCache:
+    """
+    A persistent cache of the RRA metrics of evaluated weight vectors
+    for one trial.  Each entry is one tab-delimited line (appended as
+    soon as the simulation is done), so the file survives a crash.
+    Entries with a different trial or model hash are ignored.
+    """
+
+    def __init__(self,filePath,setupFilePath):
+        """
+        Create an instance of the class from the cache file path and
+        the RRA Setup file of the trial, and load matching entries.
+        """
+        self.filePath = filePath
+        setupDir = os.path.dirname(setupFilePath)
+        dom = parse(setupFilePath)
+        def getFilePaths(tagNames):
+            filePaths = []
+            for tagName in tagNames:
+                elems = dom.getElementsByTagName(tagName)
+                if len(elems) > 0 and elems[0].firstChild is not None:
+                    for fileName in elems[0].firstChild.nodeValue.split():
+                        filePaths.append(os.path.join(setupDir,fileName))
+            return filePaths
+        # Trial inputs (Setup file, kinematics and external loads)
+        self.trialHash = hashFiles([setupFilePath]+getFilePaths(['desired_kinematics_file','external_loads_file']))
+        # Model, actuators, tasks (apart from the weights) and constraints
+        self.modelHash = hashFiles(getFilePaths(['model_file','force_set_files','task_set_file','constraints_file']))
+        self.entries = {}
+        self.hits = 0
+        self.misses = 0
+        self.load()
+
+    """------------------------------------------------------------"""
+    def load(self):
+        """
+        Read the entries matching the trial and model hashes.
+        """
+        if not os.path.exists(self.filePath):
+            return
+        cacheFile = open(self.filePath,'r')
+        for line in cacheFile:
+            fields = line.rstrip('\r\n').split('\t')
+            if len(fields) != 9 or fields[0] != self.trialHash or fields[1] != self.modelHash:
+                continue
+            weights = tuple(fields[2].split(','))
+            self.entries[weights] = (fields[3].split(','),[float(x) for x in fields[4].split(',')],[float(x) for x in fields[5].split(',')],
+                                     fields[6].split(','),[float(x) for x in fields[7].split(',')],[float(x) for x in fields[8].split(',')])
+        cacheFile.close()
+
+    """------------------------------------------------------------"""
+    def get(self,weights):
+        """
+        Return the cached metrics of a weight vector (None if the
+        vector has not been simulated), and count the hit or miss.
+        """
+        metrics = self.entries.get(tuple(weights))
+        if metrics is None:
+            self.misses+=1
+        else:
+            self.hits+=1
+        return metrics
+
+    """------------------------------------------------------------"""
+    def put(self,weights,metrics):
+        """
+        Store the metrics of a weight vector (failed or stopped
+        simulations and weight vectors already in the cache are not
+        stored).
+        """
+        if not isinstance(metrics,tuple) or tuple(weights) in self.entries:
+            return
+        self.entries[tuple(weights)] = metrics
+        residualNames, maxResiduals, rmsResiduals, posErrNames, maxPosErr, rmsPosErr = metrics
+        fields = [self.trialHash,self.modelHash,','.join(weights),
+                  ','.join(residualNames),','.join([repr(x) for x in maxResiduals]),','.join([repr(x) for x in rmsResiduals]),
+                  ','.join(posErrNames),','.join([repr(x) for x in maxPosErr]),','.join([repr(x) for x in rmsPosErr])]
+        cacheFile = open(self.filePath,'a')
+        cacheFile.write('\t'.join(fields)+'\n')
+        cacheFile.close()
+
+    """------------------------------------------------------------"""
+    def hitRate(self):
+        """
+        Return the hit rate since the last reset, and reset the counts.
+        """
+        total = self.hits+self.misses
+        rate = float(self.hits)/total if total > 0 else 0.0
+        self.hits = 0
+        self.misses = 0
+        return rate
+
+
+class simpleGA:
+    
+    def __init__(self):
+        self.populationSize = 8
+        self.chromosomeLength = 3
+        self.pCrossover = 0.8
+        self.pMutation = float(1)/float(self.populationSize*2)
+        self.maxGen = 300
+        self.variableValues = ['1','5','10','20','50','100','500','1000']
+        self.variableNames = ['pelvis_tz','pelvis_tx','pelvis_ty','pelvis_tilt','pelvis_list','pelvis_rotation',
+                              'hip_flexion_r','hip_adduction_r','hip_rotation_r','knee_angle_r','ankle_angle_r',
+                              'hip_flexion_l','hip_adduction_l','hip_rotation_l','knee_angle_l','ankle_angle_l',
+                              'lumbar_extension','lumbar_bending','lumbar_rotation']
+                              # subtalar_angle_r, mtp_angle_r, subtalar_angle_l, mtp_angle_l --> locked
+        self.numChromosomes = len(self.variableNames)
+        # Random number generator (seed None draws a new seed)
+        self.seed = None
+        self.randState = numpy.random.RandomState(self.seed)
+        self.subjectsDir = 'H:\\Northwestern-RIC\\Modeling\\OpenSim\\Subjects\\'
+        self.subDir = self.subjectsDir+'20130221CONF\\'
+        self.trialName = '20130221CONF_A_Walk_RepGRF'
+        # Trials evaluated for each weight set (the log files are named after trialName)
+        self.trialNames = [self.trialName]
+        # Combination of the tiered scores of the trials ('mean' or 'worst')
+        self.combine = 'mean'
+        # Stop simulations that cannot beat the worst fitness kept
+        self.earlyTermination = True
+        self.log = self.subDir+self.trialName+'_RRA__GA.data'
+        self.summary = self.subDir+self.trialName+'_RRA__GA_Summary.log'
+        # Persistent caches of simulated weight vectors (one per trial, created when needed)
+        self.caches = {}
+        # Only write the RRA outputs scored by the fitness function
+        self.outputProfile = 'ga-fitness'
+        # Surrogate pre-screening of unseen offspring (None or 'knn')
+        self.surrogate = None
+        # Fraction of the unseen offspring that is simulated (best predictions first)
+        self.surrogateFraction = 0.5
+        # Probability of simulating one of the other offspring anyway
+        self.explorationRate = 0.1
+        # Number of neighbours and minimum number of cached weight vectors for the surrogate
+        self.numNeighbours = 5
+        self.minTrainingSize = 2*self.populationSize
+        self.surrogateLog = self.subDir+self.trialName+'_RRA__GA_Surrogate.log'
+        # Timing of every evaluation
+        self.timingLog = self.subDir+self.trialName+'_RRA__GA_Timing.log'
+        self.windowStartTime = time.time()
+        # Fitnesses of the cached weight vectors (training data)
+        self.knownFitnesses = {}
+        # Optimizer mode ('generational' or 'steady-state') and candidate sampler
+        # of the steady-state mode ('ga' or 'cmaes')
+        self.mode = 'generational'
+        self.sampler = 'ga'
+        self.cma = None
+        # Number of candidates so far, the initial population included
+        # (individual IDs of the steady-state mode)
+        self.numCandidates = 0
+        # Checkpoint (written after every generation)
+        self.checkpointFile = self.subDir+self.trialName+'_RRA__GA_Checkpoint.pkl'
+        # Number of individuals evaluated at once (1 runs in this process)
+        self.numWorkers = 8
+        self.pool = None
+        # Sandbox folders of the individuals
+        self.sandboxDir = self.subDir+self.trialName+'_GA\\'
+
+    def createReport(self):
+        # Detailed report
+        logReport = []
+        header1 = ('Generation\tIndividual\tTrial\tWeights'+'\t'*19+'Max Residual Force'+'\t'*3+'RMS Residual Force'+'\t'*3+'Max Residual Moment'+'\t'*3+'RMS Residual Moment'+'\t'*3+
+                   'Max Position Error (cm)'+'\t'*3+'RMS Position Error (cm)'+'\t'*3+'Max Position Error (deg)'+'\t'*16+'RMS Position Error (deg)'+'\t'*16+'Fitness\n')
+        logReport.append(header1)
+        header2 = '\t'.join(['','','']+self.variableNames+['FX','FY','FZ']*2+['MX','MY','MZ']*2+self.variableNames[0:3]*2+self.variableNames[3:]*2+[''])+'\n'
+        logReport.append(header2)
+        # Write to file
+        logFile = open(self.log,'w')
+        logFile.writelines(logReport)
+        logFile.close()
+        # Summary report
+        summaryFile = open(self.summary,'w')
+        summaryFile.write('\t'.join(['Generation','Average Fitness','Max Fitness','Current Time','Cache Hit Rate',
+                                     'Simulations','Utilization','Evaluations/Hour'])+'\n')
+        summaryFile.close()
+        # Timing report
+        timingFile = open(self.timingLog,'w')
+        timingFile.write('\t'.join(['Generation','Individual','Trial','Source','Worker','Queue Wait (s)','Wall Time (s)'])+'\n')
+        timingFile.close()
+        # Surrogate report
+        if self.surrogate is not None:
+            surrogateFile = open(self.surrogateLog,'w')
+            surrogateFile.write('\t'.join(['Generation','Unseen Offspring','Simulated','Predicted Only',
+                                           'Mean Abs Error (log10 fitness)','Rank Correlation'])+'\n')
+            surrogateFile.close()
+
+    def initializePopulation(self):
+        self.currentGen = 0
+        # Random bits (one row per individual)
+        gen0 = self.randState.randint(0,2,(self.populationSize,self.numChromosomes*self.chromosomeLength)).astype(numpy.uint8)
+        return gen0
+
+    def decode(self,population):
+        # Decode the bits of each chromosome into integers (bit i is worth 2**i)
+        chromosomes = population.reshape(-1,self.numChromosomes,self.chromosomeLength)
+        return chromosomes.dot(2**numpy.arange(self.chromosomeLength))
+
+    def decodeWeights(self,population):
+        # Decode each individual into (coordinate name, weight) pairs
+        indices = self.decode(population)
+        return [[(self.variableNames[i],self.variableValues[index]) for (i,index) in enumerate(row)] for row in indices]
+
+    def getTrialDir(self,trialName):
+        # Subject directory of a trial
+        return self.subjectsDir+trialName.split('_')[0]+'\\'
+
+    def getCache(self,trialName):
+        # Cache of a trial
+        if trialName not in self.caches:
+            trialDir = self.getTrialDir(trialName)
+            self.caches[trialName] = fitnessCache(trialDir+trialName+'_RRA__GA_Cache.data',trialDir+trialName+'__Setup_RRA.xml')
+        return self.caches[trialName]
+
+    def cacheHitRate(self):
+        # Hit rate of the trial caches since the last call
+        hits = sum([self.getCache(trialName).hits for trialName in self.trialNames])
+        total = hits+sum([self.getCache(trialName).misses for trialName in self.trialNames])
+        for trialName in self.trialNames:
+            self.getCache(trialName).hitRate()
+        return float(hits)/total if total > 0 else 0.0
+
+    def makeTask(self,sandboxName,trialName,weights,killFitness=None):
+        # Maximum score of the trial (the other trials score at least 0)
+        maxWeightSum = None
+        if self.earlyTermination and killFitness is not None:
+            if self.combine == 'mean':
+                maxWeightSum = len(self.trialNames)/killFitness
+            else:
+                maxWeightSum = 1/killFitness
+        # Sandbox task for one trial
+        return (self.sandboxDir+sandboxName+'\\',trialName,self.getTrialDir(trialName)+trialName+'__Setup_RRA.xml',self.outputProfile,weights,maxWeightSum)
+
+    def combinedFitness(self,trialResults):
+        # Fitness from the combined tiered scores of the trials (failed if any trial failed)
+        if None in [trialResults.get(trialName) for trialName in self.trialNames]:
+            return 0.0000000001
+        # (Score bound of a stopped simulation)
+        weightSums = [trialResults[trialName] if isinstance(trialResults[trialName],float) else scoreMetrics(trialResults[trialName])[0] for trialName in self.trialNames]
+        if self.combine == 'mean':
+            return 1/numpy.mean(weightSums)
+        elif self.combine == 'worst':
+            return 1/numpy.max(weightSums)
+        else:
+            raise ValueError('Unknown combination: '+str(self.combine)+' (choose from mean, worst)')
+
+    def formatLogLines(self,rowLabels,values,trialResults):
+        # Log lines of an individual (one per trial, and the combined fitness for several trials)
+        logReport = []
+        for trialName in self.trialNames:
+            logReportLine = rowLabels+[trialName]+list(values)
+            # Stopped simulation (blank metrics and fitness bound)
+            if isinstance(trialResults.get(trialName),float):
+                logReportLine += ['']*(12+2*self.numChromosomes)+[str(1/trialResults[trialName])]
+            elif trialResults.get(trialName) is not None:
+                fitness,metricFields = self.processMetrics(trialResults[trialName])
+                logReportLine += metricFields
+            logReport.append('\t'.join(logReportLine)+'\n')
+        fitness = self.combinedFitness(trialResults)
+        if len(self.trialNames) > 1:
+            logReport.append('\t'.join(rowLabels+['Combined']+list(values)+['']*(12+2*self.numChromosomes)+[str(fitness)])+'\n')
+        return fitness,logReport
+
+    def timingLine(self,rowLabels,trialName,result,timing=None):
+        # Timing record of the evaluation of a trial
+        if timing is None:
+            fields = [trialName,'Cache','','','']
+        else:
+            workerID, submitTime, startTime, endTime = timing
+            if result is None:
+                source = 'Failed'
+            elif isinstance(result,float):
+                source = 'Stopped'
+            else:
+                source = 'Simulation'
+            fields = [trialName,source,str(workerID),str(max(0,startTime-submitTime)),str(endTime-startTime)]
+        return '\t'.join(rowLabels+fields)+'\n'
+
+    def writeSummary(self,fitnesses,hitRate,numEvaluations,timings):
+        # Rollup since the previous generation (worker utilization and throughput)
+        elapsedTime = time.time()-self.windowStartTime
+        self.windowStartTime = time.time()
+        busyTime = sum([endTime-startTime for (workerID,submitTime,startTime,endTime) in timings])
+        numWorkers = self.numWorkers if self.pool is not None else 1
+        utilization = busyTime/(numWorkers*elapsedTime) if elapsedTime > 0 else 0.0
+        evaluationRate = numEvaluations*3600/elapsedTime if elapsedTime > 0 else 0.0
+        summaryFile = open(self.summary,'a')
+        summaryFile.write('\t'.join([str(self.currentGen),str(numpy.mean(fitnesses)),str(numpy.max(fitnesses)),time.strftime('%H:%M:%S',time.localtime()),str(hitRate),
+                                     str(len(timings)),str(utilization),str(evaluationRate)])+'\n')
+        summaryFile.close()
+        # Print to screen
+        print ('Generation '+str(self.currentGen)+' is complete. Max fitness is '+str(numpy.max(fitnesses))+' (cache hit rate '+str(round(100*hitRate))+'%, utilization '+str(round(100*utilization))+'%).')
+
+    def processMetrics(self,metrics):
+        # Fitness and log fields of the metrics of a simulation
+        weightSum,maxPosErr,rmsPosErr = scoreMetrics(metrics)
+        maxResiduals = metrics[1]
+        rmsResiduals = metrics[2]
+        metricFields = []
+        # FX, FY, FZ
+        for k in range(3): metricFields.append(str(maxResiduals[k]))
+        for k in range(3): metricFields.append(str(rmsResiduals[k]))
+        # MX, MY, MZ
+        for k in range(3,6): metricFields.append(str(maxResiduals[k]))
+        for k in range(3,6): metricFields.append(str(rmsResiduals[k]))
+        # Translations
+        for k in range(3): metricFields.append(str(maxPosErr[k]))
+        for k in range(3): metricFields.append(str(rmsPosErr[k]))
+        # Angles
+        for k in range(3,len(maxPosErr)): metricFields.append(str(maxPosErr[k]))
+        for k in range(3,len(rmsPosErr)): metricFields.append(str(rmsPosErr[k]))
+        # Individual fitness
+        metricFields.append(str(1/weightSum))
+        return 1/weightSum,metricFields
+
+    def screenCandidates(self,candidates):
+        # Predict the fitness of unseen weight vectors and choose the ones to simulate
+        predictions = {}
+        simulate = set(candidates)
+        if len(candidates) == 0:
+            return predictions,simulate
+        # Training data (log10 fitness of the weight vectors cached for all trials)
+        for values in self.getCache(self.trialNames[0]).entries:
+            if values not in self.knownFitnesses:
+                trialResults = dict([(trialName,self.getCache(trialName).entries.get(values)) for trialName in self.trialNames])
+                if None not in trialResults.values():
+                    self.knownFitnesses[values] = self.combinedFitness(trialResults)
+        if len(self.knownFitnesses) < self.minTrainingSize:
+            return predictions,simulate
+        knownValues = sorted(self.knownFitnesses.keys())
+        trainX = numpy.array([[self.variableValues.index(value) for value in values] for values in knownValues],dtype=float)
+        trainY = numpy.log10([self.knownFitnesses[values] for values in knownValues])
+        X = numpy.array([[self.variableValues.index(value) for value in values] for values in candidates],dtype=float)
+        predicted = knnPredict(trainX,trainY,X,self.numNeighbours)
+        for (values,logFitness) in zip(candidates,predicted):
+            predictions[values] = 10**logFitness
+        # Most promising fraction, and random exploration of the others
+        numSimulated = int(numpy.ceil(self.surrogateFraction*len(candidates)))
+        ranking = numpy.argsort(-predicted)
+        explore = self.randState.random_sample(len(candidates)) < self.explorationRate
+        simulate = set([candidates[i] for (r,i) in enumerate(ranking) if r < numSimulated or explore[i]])
+        return predictions,simulate
+
+    def updateSurrogateLog(self,candidates,predictions,simulate,fitnesses):
+        # Accuracy of the surrogate on the simulated offspring (failed or stopped simulations excluded)
+        predicted = []
+        actual = []
+        for values in candidates:
+            if values in predictions and values in fitnesses and fitnesses[values] > 0.0000000001:
+                predicted.append(numpy.log10(predictions[values]))
+                actual.append(numpy.log10(fitnesses[values]))
+        meanAbsErr = ''
+        rankCorr = ''
+        if len(actual) > 0:
+            meanAbsErr = str(numpy.mean(numpy.abs(numpy.array(predicted)-numpy.array(actual))))
+        if len(actual) > 2:
+            # (Spearman -- correlation of the ranks)
+            rankCorr = str(numpy.corrcoef(numpy.argsort(numpy.argsort(predicted)),numpy.argsort(numpy.argsort(actual)))[0,1])
+        surrogateFile = open(self.surrogateLog,'a')
+        surrogateFile.write('\t'.join([str(self.currentGen),str(len(candidates)),str(len(simulate)),
+                                       str(len(candidates)-len(simulate)),meanAbsErr,rankCorr])+'\n')
+        surrogateFile.close()
+
+    def calculateFitness(self,population,killFitness=None):
+        # Weights of each individual
+        weightSets = self.decodeWeights(population)
+        valueSets = [tuple([value for (name,value) in weights]) for weights in weightSets]
+        # Cached metrics of each trial
+        results = []
+        # Unseen weight vectors (not in the cache of every trial)
+        candidates = []
+        candidateIndices = {}
+        for (n,values) in enumerate(valueSets):
+            trialResults = dict([(trialName,self.getCache(trialName).get(values)) for trialName in self.trialNames])
+            results.append(trialResults)
+            if None in trialResults.values() and values not in candidateIndices:
+                candidateIndices[values] = n
+                candidates.append(values)
+        # Surrogate pre-screening
+        if self.surrogate is not None:
+            predictions,simulate = self.screenCandidates(candidates)
+        else:
+            predictions,simulate = {},set(candidates)
+        # Sandbox tasks (one per trial not in the cache, for each weight vector to simulate)
+        tasks = []
+        taskIndices = {}
+        for values in candidates:
+            if values in simulate:
+                n = candidateIndices[values]
+                for (t,trialName) in enumerate(self.trialNames):
+                    if results[n][trialName] is None:
+                        taskIndices[(values,trialName)] = len(tasks)
+                        tasks.append(self.makeTask('Individual'+str(n+1).zfill(3)+'_'+str(t+1),trialName,weightSets[n],killFitness))
+        # Run simulations (concurrently if there is a worker pool)
+        submitTime = time.time()
+        if self.pool is not None:
+            jobResults = self.pool.map(evaluateJob,list(enumerate(tasks)))
+        else:
+            jobResults = [evaluateJob(job) for job in enumerate(tasks)]
+        taskResults = [result for (jobID,result,timing) in jobResults]
+        timings = [(workerID,submitTime,startTime,endTime) for (jobID,result,(workerID,startTime,endTime)) in jobResults]
+        # Store in cache
+        for ((values,trialName),k) in taskIndices.items():
+            self.getCache(trialName).put(values,taskResults[k])
+        for (n,values) in enumerate(valueSets):
+            for trialName in self.trialNames:
+                if (values,trialName) in taskIndices:
+                    results[n][trialName] = taskResults[taskIndices[(values,trialName)]]
+        hitRate = self.cacheHitRate()
+        if self.surrogate is not None:
+            completed = [values for values in candidates if values in simulate and float not in [type(result) for result in results[candidateIndices[values]].values()]]
+            self.updateSurrogateLog(candidates,predictions,simulate,dict([(values,self.combinedFitness(results[candidateIndices[values]])) for values in completed]))
+        fitnesses = []
+        logReport = []
+        timingReport = []
+        for (n,values) in enumerate(valueSets):
+            rowLabels = [str(self.currentGen),str(n+1)]
+            # If not simulated (predicted fitness)
+            if values in predictions and values not in simulate:
+                fitnesses.append(predictions[values])
+                logReport.append('\t'.join(rowLabels+['Surrogate']+list(values)+['']*(12+2*self.numChromosomes)+[str(predictions[values])])+'\n')
+                timingReport.append('\t'.join(rowLabels+['','Surrogate','','',''])+'\n')
+                continue
+            # Process simulation output
+            fitness,logLines = self.formatLogLines(rowLabels,values,results[n])
+            fitnesses.append(fitness)
+            logReport.extend(logLines)
+            # Timing (simulated by the first individual with these weights)
+            for trialName in self.trialNames:
+                if (values,trialName) in taskIndices and candidateIndices[values] == n:
+                    k = taskIndices[(values,trialName)]
+                    timingReport.append(self.timingLine(rowLabels,trialName,taskResults[k],timings[k]))
+                else:
+                    timingReport.append(self.timingLine(rowLabels,trialName,results[n][trialName]))
+        # Write to output files
+        logFile = open(self.log,'a')
+        logFile.writelines(logReport)
+        logFile.close()
+        timingFile = open(self.timingLog,'a')
+        timingFile.writelines(timingReport)
+        timingFile.close()
+        # Summary
+        self.writeSummary(fitnesses,hitRate,len(valueSets),timings)
+        # Return
+        return fitnesses
+
+    def rouletteSelect(self,origPopulation,fitnesses,numSelected=None):
+        if numSelected is None:
+            numSelected = len(origPopulation)
+        # Cumulative probabilities
+        probIntervals = numpy.cumsum(fitnesses)/float(numpy.sum(fitnesses))
+        # Index of the first interval that contains each random number
+        r = self.randState.random_sample(numSelected)
+        indices = numpy.minimum(numpy.searchsorted(probIntervals,r),len(origPopulation)-1)
+        return origPopulation[indices]
+
+    def crossover(self,origPopulation):
+        numIndividuals = len(origPopulation)
+        numPairs = numIndividuals//2
+        # Reorder parents randomly and operate on pairs
+        parentIndices = self.randState.permutation(numIndividuals)
+        mates1 = origPopulation[parentIndices[0:2*numPairs:2]].reshape(numPairs,self.numChromosomes,self.chromosomeLength)
+        mates2 = origPopulation[parentIndices[1:2*numPairs:2]].reshape(numPairs,self.numChromosomes,self.chromosomeLength)
+        # Crossover location of each chromosome (chromosomeLength if the pair does not cross over)
+        crossPoints = self.randState.randint(1,self.chromosomeLength,(numPairs,self.numChromosomes))
+        crossPoints[self.randState.random_sample((numPairs,self.numChromosomes)) > self.pCrossover] = self.chromosomeLength
+        # Bits before the crossover location come from the first mate
+        mask = numpy.arange(self.chromosomeLength) < crossPoints[:,:,numpy.newaxis]
+        child1 = numpy.where(mask,mates1,mates2)
+        child2 = numpy.where(mask,mates2,mates1)
+        # New population (children of each pair next to each other)
+        newPopulation = numpy.stack((child1,child2),axis=1).reshape(2*numPairs,-1)
+        # Unpaired parent (odd population size)
+        if numIndividuals%2 == 1:
+            newPopulation = numpy.vstack((newPopulation,origPopulation[parentIndices[-1:]]))
+        return newPopulation
+
+    def mutation(self,origPopulation):
+        numIndividuals = len(origPopulation)
+        # Chromosomes that mutate (based on mutation probability) and mutation locations
+        mutate = self.randState.random_sample((numIndividuals,self.numChromosomes)) <= self.pMutation
+        locations = self.randState.randint(0,self.chromosomeLength,(numIndividuals,self.numChromosomes))
+        # Flip the selected bits
+        mask = mutate[:,:,numpy.newaxis] & (numpy.arange(self.chromosomeLength) == locations[:,:,numpy.newaxis])
+        newPopulation = origPopulation^mask.reshape(numIndividuals,-1).astype(numpy.uint8)
+        return newPopulation
+
+    def generation(self,origPopulation,origFitnesses):
+        # Create a new generation through select, crossover, and mutation
+        selectPopulation = self.rouletteSelect(origPopulation,origFitnesses)
+        crossoverPopulation = self.crossover(selectPopulation)
+        newPopulation = self.mutation(crossoverPopulation)
+        # Increment new population
+        self.currentGen+=1
+        # Calculate fitness of new generation
+        # (Simulations that cannot beat the worst parent are stopped)
+        newFitnesses = self.calculateFitness(newPopulation,min(origFitnesses))
+        return newPopulation,newFitnesses
+
+    def encode(self,indices):
+        # Bits of the value indices (bit i is worth 2**i)
+        bits = (numpy.asarray(indices)[...,numpy.newaxis]>>numpy.arange(self.chromosomeLength)) & 1
+        return bits.reshape(-1,self.numChromosomes*self.chromosomeLength).astype(numpy.uint8)
+
+    def sampleCandidate(self,population,fitnesses):
+        # New candidate (bits and CMA-ES sample) for the steady-state mode
+        if self.sampler == 'cmaes':
+            x = self.cma.sample()
+            # Nearest allowed weight (in log10 space)
+            logValues = numpy.log10([float(value) for value in self.variableValues])
+            indices = numpy.abs(x[:,numpy.newaxis]-logValues).argmin(1)
+            return self.encode(indices),x
+        elif self.sampler == 'ga':
+            # Two parents, one child
+            parents = self.rouletteSelect(population,fitnesses,2)
+            child = self.mutation(self.crossover(parents)[:1])
+            return child,None
+        else:
+            raise ValueError('Unknown sampler: '+str(self.sampler)+' (choose from ga, cmaes)')
+
+    def runSteadyState(self,genN,fitnesses):
+        # Asynchronous steady-state loop (each free worker gets a new candidate)
+        fitnesses = numpy.array(fitnesses,dtype=float)
+        if self.sampler == 'cmaes' and self.cma is None:
+            logValues = numpy.log10([float(value) for value in self.variableValues])
+            self.cma = diagonalCMA(logValues[self.decode(genN)].mean(0),(logValues[-1]-logValues[0])/4.0,self.populationSize,self.randState)
+        maxEvaluations = (self.maxGen-self.currentGen)*self.populationSize
+        resultQueue = queue.Queue()
+        # Candidates being evaluated and simulations in flight (job ID -> candidate ID, trial, submit time)
+        candidates = {}
+        pending = {}
+        timings = []
+        numStarted = 0
+        numCompleted = 0
+        jobID = 0
+        logReport = []
+        timingReport = []
+        numEvaluations = 0
+        while True:
+            # Give every free worker a new candidate
+            while len(pending) < self.numWorkers and numStarted < maxEvaluations and fitnesses.max() < 1:
+                bits,x = self.sampleCandidate(genN,fitnesses)
+                weights = self.decodeWeights(bits)[0]
+                values = tuple([value for (name,value) in weights])
+                numStarted+=1
+                self.numCandidates+=1
+                candidateID = self.numCandidates
+                trialResults = dict([(trialName,self.getCache(trialName).get(values)) for trialName in self.trialNames])
+                candidates[candidateID] = [bits,x,values,trialResults,0,{}]
+                for (t,trialName) in enumerate(self.trialNames):
+                    if trialResults[trialName] is None:
+                        jobID+=1
+                        pending[jobID] = (candidateID,trialName,time.time())
+                        candidates[candidateID][4]+=1
+                        task = self.makeTask('Job'+str(jobID).zfill(6),trialName,weights,fitnesses.min())
+                        if self.pool is not None:
+                            self.pool.apply_async(evaluateJob,((jobID,task),),callback=resultQueue.put)
+                        else:
+                            resultQueue.put(evaluateJob((jobID,task)))
+                # (All trials cached)
+                if candidates[candidateID][4] == 0:
+                    resultQueue.put((None,candidateID))
+            if len(pending) == 0 and resultQueue.empty():
+                break
+            # Next finished simulation
+            finishedJob = resultQueue.get()
+            if finishedJob[0] is None:
+                candidateID = finishedJob[1]
+            else:
+                finishedJobID,result,(workerID,startTime,endTime) = finishedJob
+                candidateID,trialName,submitTime = pending.pop(finishedJobID)
+                self.getCache(trialName).put(candidates[candidateID][2],result)
+                candidates[candidateID][3][trialName] = result
+                candidates[candidateID][5][trialName] = (workerID,submitTime,startTime,endTime)
+                timings.append((workerID,submitTime,startTime,endTime))
+                candidates[candidateID][4]-=1
+                # Wait for the other trials of the candidate
+                if candidates[candidateID][4] > 0:
+                    continue
+            bits,x,values,trialResults,numRemaining,trialTimings = candidates.pop(candidateID)
+            fitness,logLines = self.formatLogLines([str(self.currentGen+1),str(candidateID)],values,trialResults)
+            logReport.extend(logLines)
+            for trialName in self.trialNames:
+                timingReport.append(self.timingLine([str(self.currentGen+1),str(candidateID)],trialName,trialResults[trialName],trialTimings.get(trialName)))
+            numEvaluations+=1
+            # Replace the worst individual if the candidate is better
+            worst = fitnesses.argmin()
+            if fitness > fitnesses[worst]:
+                genN[worst] = bits[0]
+                fitnesses[worst] = fitness
+            if self.cma is not None and x is not None:
+                self.cma.tell(x,fitness)
+            # Every populationSize evaluations count as one generation
+            numCompleted+=1
+            done = numStarted >= maxEvaluations or fitnesses.max() >= 1
+            if numCompleted%self.populationSize == 0 or (done and len(candidates) == 0):
+                self.currentGen+=1
+                hitRate = self.cacheHitRate()
+                logFile = open(self.log,'a')
+                logFile.writelines(logReport)
+                logFile.close()
+                logReport = []
+                timingFile = open(self.timingLog,'a')
+                timingFile.writelines(timingReport)
+                timingFile.close()
+                timingReport = []
+                # (Simulations finished since the previous generation)
+                self.writeSummary(fitnesses,hitRate,numEvaluations,timings)
+                timings = []
+                numEvaluations = 0
+                # (In-flight candidates are not part of the checkpoint)
+                self.saveCheckpoint(genN,fitnesses.tolist())
+        return genN,fitnesses.tolist()
+
+    def saveCheckpoint(self,population,fitnesses):
+        # State of the run after the current generation
+        logFiles = [self.log,self.summary,self.surrogateLog,self.timingLog]
+        state = {'population': population,
+                 'fitnesses': fitnesses,
+                 'currentGen': self.currentGen,
+                 'randState': self.randState.get_state(),
+                 'cacheEntries': dict([(trialName,self.getCache(trialName).entries) for trialName in self.trialNames]),
+                 'cma': self.cma,
+                 'numCandidates': self.numCandidates,
+                 'logSizes': dict([(filePath,os.path.getsize(filePath)) for filePath in logFiles if os.path.exists(filePath)])}
+        # Write to a temporary file, then replace the checkpoint
+        tempFilePath = self.checkpointFile+'.tmp'
+        checkpointFile = open(tempFilePath,'wb')
+        pickle.dump(state,checkpointFile,2)
+        checkpointFile.flush()
+        os.fsync(checkpointFile.fileno())
+        checkpointFile.close()
+        if hasattr(os,'replace'):
+            os.replace(tempFilePath,self.checkpointFile)
+        else:
+            # (Python 2 -- rename does not overwrite on Windows)
+            if os.path.exists(self.checkpointFile):
+                os.remove(self.checkpointFile)
+            os.rename(tempFilePath,self.checkpointFile)
+
+    def loadCheckpoint(self):
+        # Checkpoint (or the temporary file if the replacement was interrupted)
+        if os.path.exists(self.checkpointFile):
+            checkpointFilePath = self.checkpointFile
+        else:
+            checkpointFilePath = self.checkpointFile+'.tmp'
+        checkpointFile = open(checkpointFilePath,'rb')
+        state = pickle.load(checkpointFile)
+        checkpointFile.close()
+        self.currentGen = state['currentGen']
+        self.randState.set_state(state['randState'])
+        self.cma = state.get('cma')
+        self.numCandidates = state.get('numCandidates',self.currentGen*self.populationSize)
+        if self.cma is not None:
+            self.cma.randState = self.randState
+        for (trialName,entries) in state['cacheEntries'].items():
+            for (values,metrics) in entries.items():
+                self.getCache(trialName).put(values,metrics)
+        # Remove log lines written after the checkpoint
+        for (filePath,size) in state['logSizes'].items():
+            if os.path.exists(filePath) and os.path.getsize(filePath) > size:
+                logFile = open(filePath,'r+b')
+                logFile.truncate(size)
+                logFile.close()
+        return state['population'],state['fitnesses']
+
+    def run(self,resume=False):
+        if self.mode not in ['generational','steady-state']:
+            raise ValueError('Unknown mode: '+str(self.mode)+' (choose from generational, steady-state)')
+        # Start worker pool
+        if self.numWorkers > 1:
+            self.pool = Pool(processes=self.numWorkers)
+        if resume and (os.path.exists(self.checkpointFile) or os.path.exists(self.checkpointFile+'.tmp')):
+            # Continue from the last checkpoint
+            genN,fitnesses = self.loadCheckpoint()
+            print ('Resuming after generation '+str(self.currentGen)+'.')
+            self.windowStartTime = time.time()
+        else:
+            # Initialize log report
+            self.createReport()
+            # Create new population
+            genN = self.initializePopulation()
+            self.windowStartTime = time.time()
+            fitnesses = self.calculateFitness(genN)
+            self.numCandidates = len(genN)
+            self.saveCheckpoint(genN,fitnesses)
+        # Steady-state mode
+        if self.mode == 'steady-state':
+            genN,fitnesses = self.runSteadyState(genN,fitnesses)
+        # Initialize loop
+        n = self.currentGen+1
+        while n <= self.maxGen and self.mode == 'generational':
+            if max(fitnesses) < 1:
+                # Create a new generation
+                genN,fitnesses = self.generation(genN,fitnesses)
+                self.saveCheckpoint(genN,fitnesses)
+                # Increment
+                n+=1
+            else:
+                break
+        # Clean up spawned processes
+        if self.pool is not None:
+            self.pool.close()
+            self.pool.join()
+            self.pool = None
+        # Remove the checkpoint of the finished run
+        for filePath in [self.checkpointFile,self.checkpointFile+'.tmp']:
+            if os.path.exists(filePath):
+                os.remove(filePath)
+
+# ******************************************************************************
+
+if __name__ == '__main__':
+    # Create instance of class
+    sga = simpleGA()
+    # Run code (continues from the checkpoint of an interrupted run if there is one)
+    sga.run(resume=True)
+
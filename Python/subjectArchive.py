@@ -0,0 +1,196 @@
+"""
+----------------------------------------------------------------------
+    subjectArchive.py
+----------------------------------------------------------------------
+    This module packs the files of a subject folder into a single
+    archive (HDF5 if h5py is available, otherwise NumPy .npz), so that
+    a subject can be copied between the network share and the
+    workstations as one file.  The archive holds the contents of every
+    file (Setup files and logs included), the parsed arrays of the
+    storage/motion and marker files, and an index of the files with
+    their size, modification time, header and column names.
+
+    An archive named <subID>_Archive.h5 (or .npz) in the subject
+    folder is read transparently by readResults (and therefore by
+    Subject/Simulation in processResults): archived files are loaded
+    from it, without parsing, unless the file itself has changed since
+    it was archived.  Importing an archive copies it into the subject
+    folder and can also restore the original files.
+
+    Input:
+        Subject ID list, folder for copies of the archives
+    Output:
+        <subID>_Archive.h5 or .npz in each subject folder
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Input                                            #
+#                                                                    #
+# ####################################################################
+# Subject ID list
+subIDs = ['20130221CONF']
+# Folder for copies of the archives (e.g. on the network share), or None
+archiveDir = None
+# ####################################################################
+
+
+# Imports
+import os
+import shutil
+
+import numpy as np
+try:
+    import h5py
+except ImportError:
+    h5py = None
+
+from readResults import parseStorage, parseTRC, replaceFile, packIndex, unpackIndex, archives
+
+
+# Parsers of the archived result files (by extension)
+parsers = {'.sto': parseStorage, '.mot': parseStorage, '.trc': parseTRC}
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def getSubjectDir(subID):
+    """
+    Return the subject directory.
+    """
+    nuDir = os.getcwd()
+    while os.path.basename(nuDir) != 'Northwestern-RIC':
+        nuDir = os.path.dirname(nuDir)
+    return os.path.join(nuDir,'Modeling','OpenSim','Subjects',subID)+'\\'
+
+# ####################################################################
+
+def getArchiveFiles(subDir,subID):
+    """
+    Return the names of the files of a subject folder to archive
+    (without the sidecar cache and index files of readResults and the
+    archives themselves).
+    """
+    fileNames = sorted([fileName for fileName in os.listdir(subDir) if os.path.isfile(os.path.join(subDir,fileName))])
+    archiveFiles = []
+    for fileName in fileNames:
+        if fileName in [subID+'_Archive.h5',subID+'_Archive.npz'] or fileName.endswith('.tmp'):
+            continue
+        # (Sidecar files: name of a file in the folder + '.npy'/'.json' or '.idx.npy'/'.idx.json')
+        stem = os.path.splitext(fileName)[0]
+        if fileName.endswith(('.npy','.json')) and (stem in fileNames or (stem.endswith('.idx') and stem[:-4] in fileNames)):
+            continue
+        archiveFiles.append(fileName)
+    return archiveFiles
+
+# ####################################################################
+
+def exportSubject(subID,archivePath=None,fileFormat=None):
+    """
+    Pack the files of a subject folder into an archive (fileFormat
+    'h5' or 'npz', by default 'h5' if h5py is available).  Returns the
+    archive path.
+    """
+    subDir = getSubjectDir(subID)
+    if fileFormat is None:
+        fileFormat = 'npz' if h5py is None else 'h5'
+    if archivePath is None:
+        archivePath = subDir+subID+'_Archive.'+fileFormat
+    index = {}
+    members = {}
+    for (k,fileName) in enumerate(getArchiveFiles(subDir,subID)):
+        filePath = os.path.join(subDir,fileName)
+        fileStat = os.stat(filePath)
+        rawFile = open(filePath,'rb')
+        members['raw'+str(k)] = np.frombuffer(rawFile.read(),dtype=np.uint8)
+        rawFile.close()
+        entry = {'size': fileStat.st_size, 'mtime': fileStat.st_mtime, 'raw': 'raw'+str(k)}
+        # Parsed arrays of result files (files that cannot be parsed are only stored;
+        # read without the sidecar cache, which can be kept in the folder)
+        extension = os.path.splitext(fileName)[1].lower()
+        if extension in parsers:
+            try:
+                header, names, data = parsers[extension](filePath)
+                members['data'+str(k)] = data
+                entry.update({'data': 'data'+str(k), 'header': header, 'names': names})
+            except Exception:
+                print ('Unable to parse '+fileName+' -- stored without data.')
+        index[fileName] = entry
+    # Write to a temporary file, then replace the archive
+    tempPath = archivePath+'.tmp'
+    if fileFormat == 'h5':
+        if h5py is None:
+            raise ImportError('h5py is required to write '+archivePath)
+        archiveFile = h5py.File(tempPath,'w')
+        for key in members:
+            archiveFile.create_dataset(key,data=members[key])
+        archiveFile.create_dataset('index',data=packIndex(index))
+        archiveFile.close()
+    else:
+        archiveFile = open(tempPath,'wb')
+        np.savez(archiveFile,index=packIndex(index),**members)
+        archiveFile.close()
+    # (Close an open copy of the old archive first)
+    if archivePath in archives:
+        archives.pop(archivePath)[1].close()
+    replaceFile(tempPath,archivePath)
+    print (str(len(index))+' files of '+subID+' archived in '+archivePath)
+    return archivePath
+
+# ####################################################################
+
+def importSubject(archivePath,extract=False):
+    """
+    Copy an archive into its subject folder (subject ID from the
+    archive name).  With extract, the archived files that are missing
+    from the folder are also restored (with their modification time).
+    Returns the subject directory.
+    """
+    subID = os.path.basename(archivePath).split('_Archive')[0]
+    subDir = getSubjectDir(subID)
+    if not os.path.exists(subDir):
+        os.makedirs(subDir)
+    localPath = os.path.join(subDir,os.path.basename(archivePath))
+    if os.path.abspath(localPath) != os.path.abspath(archivePath):
+        shutil.copy2(archivePath,localPath)
+    if extract:
+        if localPath.endswith('.h5'):
+            if h5py is None:
+                raise ImportError('h5py is required to read '+localPath)
+            archiveFile = h5py.File(localPath,'r')
+        else:
+            archiveFile = np.load(localPath)
+        index = unpackIndex(archiveFile['index'])
+        numRestored = 0
+        for fileName in sorted(index):
+            filePath = os.path.join(subDir,fileName)
+            if os.path.exists(filePath):
+                continue
+            rawFile = open(filePath,'wb')
+            rawFile.write(np.asarray(archiveFile[index[fileName]['raw']]).tobytes())
+            rawFile.close()
+            os.utime(filePath,(index[fileName]['mtime'],index[fileName]['mtime']))
+            numRestored += 1
+        archiveFile.close()
+        print (str(numRestored)+' files of '+subID+' restored from '+localPath)
+    return subDir
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    for subID in subIDs:
+        # Pack subject folder
+        archivePath = exportSubject(subID)
+        # Copy to the archive folder
+        if archiveDir is not None:
+            shutil.copy2(archivePath,archiveDir)
@@ -0,0 +1,191 @@
+"""
+----------------------------------------------------------------------
+    verifyForward.py
+----------------------------------------------------------------------
+    This program verifies the CMC results of all completed trials by
+    forward simulation.  The CMC controls (_CMC_controls.xml) and
+    initial states (_CMC_states.sto) drive the Forward tool (from
+    XML/Setup_Forward.xml), and the resulting coordinates are compared
+    with the CMC kinematics (_CMC_Kinematics_q.sto).
+
+    The Forward step can also be run from runSubjectParallel, in the
+    same worker pool as the other simulation steps.
+
+    Input:
+        Subject ID list
+    Output:
+        Forward simulation results
+        Cohort table of tracking errors (Forward_TrackingError.data)
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Input                                            #
+#                                                                    #
+# ####################################################################
+# Subject ID list
+subIDs = ['20130221CONF']
+# ####################################################################
+
+
+# Imports
+import os
+import glob
+from multiprocessing import Pool
+
+import numpy as np
+
+from runToolsParallel import forward
+from writeSetupXML import setupXML, compileForwardTemplate
+from readResults import readStorage
+
+
+# Translational coordinates (m) -- all others are in degrees
+translations = ['pelvis_tx','pelvis_ty','pelvis_tz']
+
+# Forward template (compiled once per process)
+forwardTemplate = None
+
+
+"""*******************************************************************
+*                   Functions                                        *
+*******************************************************************"""
+
+def getSubjectsDir():
+    """
+    Return the directory containing all subject folders.
+    """
+    nuDir = os.getcwd()
+    while os.path.basename(nuDir) != 'Northwestern-RIC':
+        nuDir = os.path.dirname(nuDir)
+    return os.path.join(nuDir,'Modeling','OpenSim','Subjects')+'\\'
+
+# ####################################################################
+
+def getCompletedTrials(subID):
+    """
+    Return the names of the trials with CMC controls and states.
+    """
+    subDir = getSubjectsDir()+subID+'\\'
+    trialNames = []
+    for controlsPath in glob.glob(subDir+subID+'*_CMC_controls.xml'):
+        trialName = os.path.basename(controlsPath).split('_CMC_controls.xml')[0]
+        if os.path.exists(subDir+trialName+'_CMC_states.sto'):
+            trialNames.append(trialName)
+    return sorted(trialNames)
+
+# ####################################################################
+
+def runForwardParallel(trialName):
+    """
+    Picklable function for writing the Forward setup file and running
+    the Forward tool for one trial.
+    """
+    global forwardTemplate
+    if forwardTemplate is None:
+        forwardTemplate = compileForwardTemplate()
+    setXML = setupXML(trialName.split('_')[0])
+    setXML.writeForward(forwardTemplate,trialName)
+    fwdTool = forward(trialName)
+    fwdTool.run()
+    return None
+
+# ####################################################################
+
+def trackingError(subDir,trialName):
+    """
+    Compare the Forward coordinates with the CMC kinematics of a
+    trial.  The Forward results are interpolated to the CMC time
+    points within the common time range.  Returns the coordinate names
+    and arrays of the RMS and maximum absolute errors (cm or deg).
+    """
+    headerList, cmcNames, cmcData = readStorage(subDir+trialName+'_CMC_Kinematics_q.sto')
+    headerList, fwdNames, fwdData = readStorage(subDir+trialName+'_Forward_Kinematics_q.sto')
+    names = [name for name in cmcNames[1:] if name in fwdNames]
+    # Common time range
+    cmcTime = cmcData[:,0]
+    inRange = (cmcTime >= fwdData[0,0]) & (cmcTime <= fwdData[-1,0])
+    time = cmcTime[inRange]
+    # Interpolate Forward results to CMC time points
+    cmcCols = cmcData[np.ix_(inRange,[cmcNames.index(name) for name in names])]
+    fwdCols = np.column_stack([np.interp(time,fwdData[:,0],fwdData[:,fwdNames.index(name)]) for name in names])
+    errors = fwdCols-cmcCols
+    # Convert translations from m to cm
+    scale = np.array([100.0 if name in translations else 1.0 for name in names])
+    errors *= scale
+    rmsErr = np.sqrt(np.mean(np.square(errors),axis=0))
+    maxErr = np.abs(errors).max(axis=0)
+    return names, rmsErr, maxErr
+
+# ####################################################################
+
+def writeCohortTable(subIDs,filePath=None):
+    """
+    Write a tab-delimited table of the Forward tracking errors (one
+    row per trial) for a list of subjects.
+    """
+    if filePath is None:
+        filePath = getSubjectsDir()+'Forward_TrackingError.data'
+    rows = []
+    allNames = None
+    for subID in subIDs:
+        subDir = getSubjectsDir()+subID+'\\'
+        for trialName in getCompletedTrials(subID):
+            if not os.path.exists(subDir+trialName+'_Forward_Kinematics_q.sto'):
+                print (trialName+'_Forward is missing.')
+                continue
+            try:
+                names, rmsErr, maxErr = trackingError(subDir,trialName)
+            except:
+                print ('Unable to compare '+trialName+'_Forward with CMC.')
+                continue
+            if allNames is None:
+                allNames = names
+            # Align columns with the first trial
+            rmsRow = [str(rmsErr[names.index(name)]) if name in names else '' for name in allNames]
+            maxRow = [str(maxErr[names.index(name)]) if name in names else '' for name in allNames]
+            rows.append('\t'.join([trialName]+rmsRow+maxRow)+'\n')
+    if allNames is None:
+        print ('No Forward results found.')
+        return
+    # Write to file
+    tableFile = open(filePath,'w')
+    tableFile.write('Trial\tRMS Tracking Error (cm or deg)'+'\t'*len(allNames)+'Max Tracking Error (cm or deg)\n')
+    tableFile.write('\t'.join(['']+allNames*2)+'\n')
+    tableFile.writelines(rows)
+    tableFile.close()
+    print (str(len(rows))+' trials written to '+filePath)
+
+# ####################################################################
+
+def runForwardCohort(subIDs,processes=10):
+    """
+    Run the Forward tool for the completed trials of all subjects
+    concurrently.
+    """
+    trialNames = []
+    for subID in subIDs:
+        trialNames.extend(getCompletedTrials(subID))
+    # Start worker pool
+    pool = Pool(processes=processes)
+    # Run parallel processes
+    pool.map(runForwardParallel, trialNames)
+    # Clean up spawned processes
+    pool.close()
+    pool.join()
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    # Forward simulations
+    runForwardCohort(subIDs)
+    # Cohort table
+    writeCohortTable(subIDs)
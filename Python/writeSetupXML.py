@@ -0,0 +1,492 @@
+"""
+----------------------------------------------------------------------
+    writeSetupXML.py
+----------------------------------------------------------------------
+    This program exports all of the necessary Setup (*.xml) files for
+    a list of subjects without the OpenSim GUI.  It replaces the
+    GUI-only writeSetupXMLfromGUI script: time ranges are read
+    directly from the TRC and GRF files, and the template files in
+    XML/<model>_LowerLimbTorso/ are filled in instead of building
+    Tool objects through the OpenSim API.  As in the GUI script, the
+    generic model and the marker set of the subject's experiment are
+    taken from the GenericFiles folder next to the Subjects folder.
+
+    Each template is parsed once and precompiled into a list of text
+    fragments, so writing a Setup file for a trial only joins strings.
+    The Setup files of all subjects and trials are written in
+    parallel.
+
+    Input arguments:
+        subIDs (list)
+        genericModelName (string -- gait2392, Arnold2010,
+                          Arnold2010_MillardEquilibrium,
+                          Arnold2010_MillardAcceleration)
+    Output:
+        Setup XML files
+        External Loads XML files
+----------------------------------------------------------------------
+    Last Modified 2026-10-19
+----------------------------------------------------------------------
+"""
+
+
+# ####################################################################
+#                                                                    #
+#                   Inputs                                           #
+#                                                                    #
+# ####################################################################
+# Generic model to use
+genericModelName = 'Arnold2010_MillardEquilibrium'
+# Subject ID
+subIDs = ['20121204APRM','20121204CONF','20121205CONM','20121206CONF']
+# ####################################################################
+
+
+# Imports
+import os
+import re
+import io
+import glob
+import math
+from xml.dom.minidom import parse
+from xml.sax.saxutils import escape
+from multiprocessing import Pool
+
+from outputProfiles import applyOutputProfile
+
+
+# Directory containing the template XML files of this repository
+xmlDir = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))),'XML')
+
+
+"""*******************************************************************
+*                   Time Ranges                                      *
+*******************************************************************"""
+
+def getLastLine(lineList):
+    """
+    Return the last non-blank line of a list of text lines.
+    """
+    for line in reversed(lineList):
+        if line.strip() != '':
+            return line
+    return ''
+
+# ####################################################################
+
+def getTRCTimeRange(trcFilePath):
+    """
+    Read the first and last frame times from a TRC file.
+    """
+    trcFile = open(trcFilePath,'r')
+    trcList = trcFile.readlines()
+    trcFile.close()
+    startTime = float(trcList[6].split('\t')[1])
+    endTime = float(getLastLine(trcList).split('\t')[1])
+    return startTime, endTime
+
+# ####################################################################
+
+def getMOTTimeRange(motFilePath):
+    """
+    Read the first and last times from a MOT/STO file.
+    """
+    motFile = open(motFilePath,'r')
+    motList = motFile.readlines()
+    motFile.close()
+    for (i,line) in enumerate(motList):
+        if line.strip().lower() == 'endheader':
+            break
+    startTime = float(motList[i+2].split()[0])
+    endTime = float(getLastLine(motList).split()[0])
+    return startTime, endTime
+
+
+"""*******************************************************************
+*                   Templates                                        *
+*******************************************************************"""
+
+class setupTemplate:
+    """
+    A class to precompile a template XML file.  The elements listed
+    in the fields are replaced by placeholders and the document is
+    serialized once into literal text fragments; rendering a Setup
+    file only joins the fragments with the (escaped) field values.
+    """
+
+    def __init__(self,xmlFilePath,toolTag,fields,constants=None,outputProfile=None):
+        """
+        Parse the template and precompile it.  Fields map a key to a
+        (tag name, occurrence) pair; the key 'name' refers to the name
+        attribute of the tool element.  Constants are written into the
+        template once, as are the analyses of the output profile.
+        """
+        dom = parse(xmlFilePath)
+        toolElem = dom.getElementsByTagName(toolTag)[0]
+        # Output profile (RRA, CMC and Forward tools only)
+        if outputProfile is not None:
+            applyOutputProfile(dom,toolTag.replace('Tool',''),outputProfile)
+        # Constant values
+        if constants is None:
+            constants = {}
+        for (tagName,index) in constants:
+            self.setElementText(dom,toolElem,tagName,index,constants[(tagName,index)])
+        # Placeholders
+        toolElem.setAttribute('name','@@name@@')
+        for key in fields:
+            (tagName,index) = fields[key]
+            self.setElementText(dom,toolElem,tagName,index,'@@'+key+'@@')
+        # Split serialized document into literal fragments and keys
+        xmlString = dom.toxml('UTF-8').decode('utf-8')
+        self.parts = re.split(r'@@(\w+)@@',xmlString)
+
+    """------------------------------------------------------------"""
+    def setElementText(self,dom,toolElem,tagName,index,value):
+        """
+        Replace the text of an element.
+        """
+        elem = toolElem.getElementsByTagName(tagName)[index]
+        for child in list(elem.childNodes):
+            elem.removeChild(child)
+        elem.appendChild(dom.createTextNode(' '+str(value)+' '))
+
+    """------------------------------------------------------------"""
+    def render(self,values):
+        """
+        Return the Setup file text for a dictionary of field values.
+        """
+        pieces = list(self.parts)
+        for i in range(1,len(pieces),2):
+            pieces[i] = escape(str(values[pieces[i]]))
+        return u''.join(pieces)
+
+    """------------------------------------------------------------"""
+    def write(self,filePath,values):
+        """
+        Render and write a Setup file.
+        """
+        xmlFile = io.open(filePath,'w',encoding='utf-8')
+        xmlFile.write(self.render(values))
+        xmlFile.close()
+
+# ####################################################################
+
+def compileTemplates(genericModelName,outputProfile='analysis'):
+    """
+    Precompile the templates of the generic model.  Returns a
+    dictionary mapping the tool names to setupTemplate objects.
+    """
+    model = genericModelName.split('_')[0]
+    templateDir = os.path.join(xmlDir,model+'_LowerLimbTorso')
+    # Scale template (model specific file name, if it exists)
+    scaleTemplatePath = os.path.join(templateDir,model+'_Setup_Scale.xml')
+    if not os.path.exists(scaleTemplatePath):
+        scaleTemplatePath = os.path.join(templateDir,'Setup_Scale.xml')
+    # Fast optimization target
+    if model == 'gait2392':
+        useFastTarget = 'true'
+    else:
+        useFastTarget = 'false'
+    templates = {}
+    templates['Scale'] = setupTemplate(scaleTemplatePath,'ScaleTool',
+                                       {'genericModelFile': ('model_file',0),
+                                        'markerSetFile': ('marker_set_file',0),
+                                        'mass': ('mass',0),
+                                        'height': ('height',0),
+                                        'markerFile': ('marker_file',0),
+                                        'timeRange': ('time_range',0),
+                                        'tempModelFile': ('output_model_file',0),
+                                        'scaleFile': ('output_scale_file',0),
+                                        'staticMarkerFile': ('marker_file',1),
+                                        'staticTimeRange': ('time_range',1),
+                                        'motionFile': ('output_motion_file',0),
+                                        'modelFile': ('output_model_file',1)},
+                                       {('preserve_mass_distribution',0): 'true'})
+    templates['IK'] = setupTemplate(os.path.join(templateDir,'Setup_IK.xml'),'InverseKinematicsTool',
+                                    {'resultsDir': ('results_directory',0),
+                                     'modelFile': ('model_file',0),
+                                     'markerFile': ('marker_file',0),
+                                     'timeRange': ('time_range',0),
+                                     'motionFile': ('output_motion_file',0)})
+    templates['ExternalLoads'] = setupTemplate(os.path.join(templateDir,'GRF.xml'),'ExternalLoads',
+                                               {'grfFile': ('datafile',0),
+                                                'ikFile': ('external_loads_model_kinematics_file',0)},
+                                               {('lowpass_cutoff_frequency_for_load_kinematics',0): 6})
+    templates['ID'] = setupTemplate(os.path.join(templateDir,'Setup_ID.xml'),'InverseDynamicsTool',
+                                    {'resultsDir': ('results_directory',0),
+                                     'modelFile': ('model_file',0),
+                                     'timeRange': ('time_range',0),
+                                     'externalLoadsFile': ('external_loads_file',0),
+                                     'ikFile': ('coordinates_file',0),
+                                     'idFile': ('output_gen_force_file',0)},
+                                    {('lowpass_cutoff_frequency_for_coordinates',0): 6})
+    templates['RRA'] = setupTemplate(os.path.join(templateDir,'Setup_RRA.xml'),'RRATool',
+                                     {'modelFile': ('model_file',0),
+                                      'resultsDir': ('results_directory',0),
+                                      'startTime': ('initial_time',0),
+                                      'endTime': ('final_time',0),
+                                      'externalLoadsFile': ('external_loads_file',0),
+                                      'ikFile': ('desired_kinematics_file',0),
+                                      'adjustedModelFile': ('output_model_file',0)},
+                                     {('force_set_files',0): os.path.join(templateDir,model+'_RRA_Actuators.xml'),
+                                      ('task_set_file',0): os.path.join(templateDir,model+'_RRA_Tasks.xml'),
+                                      ('constraints_file',0): os.path.join(templateDir,model+'_RRA_ControlConstraints.xml')},
+                                     outputProfile)
+    templates['CMC'] = setupTemplate(os.path.join(templateDir,'Setup_CMC.xml'),'CMCTool',
+                                     {'modelFile': ('model_file',0),
+                                      'resultsDir': ('results_directory',0),
+                                      'startTime': ('initial_time',0),
+                                      'endTime': ('final_time',0),
+                                      'externalLoadsFile': ('external_loads_file',0),
+                                      'rraKinematicsFile': ('desired_kinematics_file',0)},
+                                     {('force_set_files',0): os.path.join(templateDir,model+'_CMC_Actuators.xml'),
+                                      ('task_set_file',0): os.path.join(templateDir,model+'_CMC_Tasks.xml'),
+                                      ('constraints_file',0): os.path.join(templateDir,model+'_CMC_ControlConstraints.xml'),
+                                      ('use_fast_optimization_target',0): useFastTarget},
+                                     outputProfile)
+    return templates
+
+# ####################################################################
+
+def compileForwardTemplate(outputProfile='analysis'):
+    """
+    Precompile the Forward template (XML/Setup_Forward.xml), which is
+    shared by all generic models.
+    """
+    analysisTimes = {}
+    for i in range(4):
+        analysisTimes[('start_time',i)] = '-infinity'
+        analysisTimes[('end_time',i)] = 'infinity'
+    return setupTemplate(os.path.join(xmlDir,'Setup_Forward.xml'),'ForwardTool',
+                         {'modelFile': ('model_file',0),
+                          'forceSetFiles': ('force_set_files',0),
+                          'resultsDir': ('results_directory',0),
+                          'startTime': ('initial_time',0),
+                          'endTime': ('final_time',0),
+                          'controlsFile': ('controls_file',0),
+                          'externalLoadsFile': ('external_loads_file',0),
+                          'statesFile': ('states_file',0)},
+                         analysisTimes,outputProfile)
+
+
+"""*******************************************************************
+*                   Setup Files                                      *
+*******************************************************************"""
+
+class setupXML:
+    """
+    A class containing attributes and methods associated with writing
+    setup XML files from precompiled templates. A subject ID is
+    required to create an instance based on this class (and a generic
+    model name to write the scale step).
+    """
+
+    def __init__(self,subID,genericModelName=None):
+        """
+        Method to create an instance of the setupXML class. Attributes
+        include the subject ID, generic model name, subject directory,
+        and generic file directory.
+        """
+        self.subID = subID
+        self.genericModelName = genericModelName
+        nuDir = os.getcwd()
+        while os.path.basename(nuDir) != 'Northwestern-RIC':
+            nuDir = os.path.dirname(nuDir)
+        self.subDir = os.path.join(nuDir,'Modeling','OpenSim','Subjects',subID)+'\\'
+        self.genDir = os.path.dirname(os.path.dirname(self.subDir[0:-2]))+'\\GenericFiles\\'
+
+    """------------------------------------------------------------"""
+    def readPersonalInfoXML(self):
+        """
+        Reads personal information xml file and adds attriubutes
+        associated with the subject's mass, height, and the marker set
+        used during the experiment.
+        """
+        persInfoXML = glob.glob(self.subDir+'*__PersonalInformation.xml')[0]
+        dom = parse(persInfoXML)
+        self.mass = float(dom.getElementsByTagName('mass')[0].firstChild.nodeValue)
+        self.height = float(dom.getElementsByTagName('height')[0].firstChild.nodeValue)
+        self.markerSet = dom.getElementsByTagName('markerSet')[0].firstChild.nodeValue
+
+    """------------------------------------------------------------"""
+    def getTrialNames(self):
+        """
+        Get all of the dynamic trial names (from the TRC files).
+        """
+        trcFilePathList = glob.glob(self.subDir+self.subID+'_*_*_*.trc')
+        return sorted([os.path.splitext(os.path.basename(trcFilePath))[0] for trcFilePath in trcFilePathList])
+
+    """------------------------------------------------------------"""
+    def writeScale(self,templates):
+        """
+        Write setup file for scale step.
+        """
+        # Generic model and marker set (named as in the GUI script)
+        genericModelFile = self.genDir+self.genericModelName+'.osim'
+        markerSetFile = self.genDir+self.genericModelName.split('_')[0]+'_'+self.markerSet+'_Scale_MarkerSet.xml'
+        for filePath in [genericModelFile,markerSetFile]:
+            if not os.path.exists(filePath):
+                raise IOError('Generic file not found for '+self.genericModelName+': '+filePath)
+        trialName = self.subID+'_0_StaticPose'
+        (startTime,endTime) = getTRCTimeRange(self.subDir+trialName+'.trc')
+        timeRange = str(startTime)+' '+str(endTime)
+        templates['Scale'].write(self.subDir+trialName+'__Setup_Scale.xml',
+                                 {'name': self.subID,
+                                  'genericModelFile': genericModelFile,
+                                  'markerSetFile': markerSetFile,
+                                  'mass': self.mass,
+                                  'height': self.height,
+                                  'markerFile': self.subDir+trialName+'.trc',
+                                  'timeRange': timeRange,
+                                  'tempModelFile': self.subDir+'TempScaled.osim',
+                                  'scaleFile': self.subDir+trialName+'_ScaleSet.xml',
+                                  'staticMarkerFile': self.subDir+trialName+'.trc',
+                                  'staticTimeRange': timeRange,
+                                  'motionFile': self.subDir+trialName+'_Scale.mot',
+                                  'modelFile': self.subDir+self.subID+'.osim'})
+
+    """------------------------------------------------------------"""
+    def writeTrial(self,templates,trialName):
+        """
+        Write the IK, External Loads, ID, RRA and CMC setup files for a
+        single dynamic trial.
+        """
+        trialPath = self.subDir+trialName
+        # Time ranges
+        (trcStart,trcEnd) = getTRCTimeRange(trialPath+'.trc')
+        (grfStart,grfEnd) = getMOTTimeRange(trialPath+'_GRF.mot')
+        startTime = math.ceil(grfStart*1000)/1000
+        endTime = math.floor(grfEnd*1000)/1000
+        # IK
+        templates['IK'].write(trialPath+'__Setup_IK.xml',
+                              {'name': trialName,
+                               'resultsDir': self.subDir,
+                               'modelFile': self.subDir+self.subID+'.osim',
+                               'markerFile': trialPath+'.trc',
+                               'timeRange': str(trcStart)+' '+str(trcEnd),
+                               'motionFile': trialPath+'_IK.mot'})
+        # External loads
+        templates['ExternalLoads'].write(trialPath+'_ExternalLoads.xml',
+                                         {'name': trialName,
+                                          'grfFile': trialPath+'_GRF.mot',
+                                          'ikFile': trialPath+'_IK.mot'})
+        # ID
+        templates['ID'].write(trialPath+'__Setup_ID.xml',
+                              {'name': trialName,
+                               'resultsDir': self.subDir,
+                               'modelFile': self.subDir+self.subID+'.osim',
+                               'timeRange': str(grfStart)+' '+str(grfEnd),
+                               'externalLoadsFile': trialPath+'_ExternalLoads.xml',
+                               'ikFile': trialPath+'_IK.mot',
+                               'idFile': trialName+'_ID.sto'})
+        # RRA
+        templates['RRA'].write(trialPath+'__Setup_RRA.xml',
+                               {'name': trialName+'_RRA',
+                                'modelFile': self.subDir+self.subID+'.osim',
+                                'resultsDir': self.subDir,
+                                'startTime': startTime,
+                                'endTime': endTime,
+                                'externalLoadsFile': trialPath+'_ExternalLoads.xml',
+                                'ikFile': trialPath+'_IK.mot',
+                                'adjustedModelFile': trialPath+'__AdjustedCOM.osim'})
+        # CMC
+        templates['CMC'].write(trialPath+'__Setup_CMC.xml',
+                               {'name': trialName+'_CMC',
+                                'modelFile': trialPath+'.osim',
+                                'resultsDir': self.subDir,
+                                'startTime': startTime,
+                                'endTime': endTime,
+                                'externalLoadsFile': trialPath+'_ExternalLoads.xml',
+                                'rraKinematicsFile': trialPath+'_RRA_Kinematics_q.sto'})
+
+    """------------------------------------------------------------"""
+    def writeForward(self,forwardTemplate,trialName):
+        """
+        Write the setup file for the Forward step of a trial that has
+        completed CMC.  The model, actuators, external loads and times
+        are taken from the CMC setup file, and the CMC controls and
+        states drive the simulation.
+        """
+        trialPath = self.subDir+trialName
+        dom = parse(trialPath+'__Setup_CMC.xml')
+        cmcValues = {}
+        for tagName in ['model_file','force_set_files','external_loads_file','initial_time','final_time']:
+            cmcValues[tagName] = dom.getElementsByTagName(tagName)[0].firstChild.nodeValue.strip()
+        forwardTemplate.write(trialPath+'__Setup_Forward.xml',
+                              {'name': trialName+'_Forward',
+                               'modelFile': cmcValues['model_file'],
+                               'forceSetFiles': cmcValues['force_set_files'],
+                               'resultsDir': self.subDir,
+                               'startTime': cmcValues['initial_time'],
+                               'endTime': cmcValues['final_time'],
+                               'controlsFile': trialPath+'_CMC_controls.xml',
+                               'externalLoadsFile': cmcValues['external_loads_file'],
+                               'statesFile': trialPath+'_CMC_states.sto'})
+
+
+"""*******************************************************************
+*                   Parallel Execution                               *
+*******************************************************************"""
+
+workerTemplates = {}
+
+def initializeWorker(templates):
+    """
+    Store the precompiled templates once in each worker process.
+    """
+    global workerTemplates
+    workerTemplates = templates
+
+# ####################################################################
+
+def runParallel(task):
+    """
+    Picklable function for writing the setup files of one subject's
+    scale step or one dynamic trial.
+    """
+    (subID,genericModelName,mass,height,markerSet,trialName) = task
+    setXML = setupXML(subID,genericModelName)
+    setXML.mass = mass
+    setXML.height = height
+    setXML.markerSet = markerSet
+    if trialName is None:
+        setXML.writeScale(workerTemplates)
+    else:
+        setXML.writeTrial(workerTemplates,trialName)
+    return None
+
+# ####################################################################
+
+def writeCohort(subIDs,genericModelName,outputProfile='analysis',processes=8):
+    """
+    Write all setup files for a list of subjects in parallel.
+    """
+    # Compile each template once
+    templates = compileTemplates(genericModelName,outputProfile)
+    # One task for the scale step and one for each dynamic trial
+    tasks = []
+    for subID in subIDs:
+        setXML = setupXML(subID,genericModelName)
+        setXML.readPersonalInfoXML()
+        personalInfo = (setXML.mass,setXML.height,setXML.markerSet)
+        tasks.append((subID,genericModelName)+personalInfo+(None,))
+        for trialName in setXML.getTrialNames():
+            tasks.append((subID,genericModelName)+personalInfo+(trialName,))
+    # Start worker pool
+    pool = Pool(processes=processes,initializer=initializeWorker,initargs=(templates,))
+    # Run parallel processes
+    pool.map(runParallel,tasks)
+    # Clean up spawned processes
+    pool.close()
+    pool.join()
+    print (str(len(tasks))+' setup tasks written for '+str(len(subIDs))+' subjects.')
+
+
+"""*******************************************************************
+*                                                                    *
+*                   Script Execution                                 *
+*                                                                    *
+*******************************************************************"""
+if __name__ == '__main__':
+    # Write setup files for all subjects
+    writeCohort(subIDs,genericModelName)